@@ -22,7 +22,7 @@ export default function NewsList() {
     fetch("/api/news")
       .then(res => res.json())
       .then(data => {
-        setNewsItems(data || []);
+        setNewsItems(data?.results || []);
       })
       .catch(err => {
         console.error("Failed to fetch news:", err);
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Forecast, ForecastCategory
+from .models import Forecast, ForecastCategory, DocumentText
 
 admin.site.register(Forecast)
-admin.site.register(ForecastCategory)
\ No newline at end of file
+admin.site.register(ForecastCategory)
+admin.site.register(DocumentText)
\ No newline at end of file
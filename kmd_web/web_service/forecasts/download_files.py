@@ -1,7 +1,8 @@
 import os
 from pathlib import Path
-from django.http import FileResponse, Http404, JsonResponse
+from django.http import Http404, JsonResponse
 from django.conf import settings
+from forecasts.services.file_serving import serve_file
 
 def download_file(request):
     file_path = request.GET.get("path")
@@ -32,8 +33,10 @@ def download_file(request):
     original_name = full_path.name
     download_name = f"{year}-{month}-{day}-{original_name}"
 
-    # Use context manager to ensure file is properly handled
-    response = FileResponse(open(full_path, "rb"), as_attachment=True)
-    response["Content-Disposition"] = f'attachment; filename="{download_name}"'
-
-    return response
\ No newline at end of file
+    # ETag / Last-Modified from stat(); 304 answered without opening the file
+    return serve_file(
+        request,
+        full_path,
+        as_attachment=True,
+        filename=download_name,
+    )
\ No newline at end of file
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from forecasts.models import DocumentText
+from forecasts.services.doc_text import (
+    DOC_EXTENSIONS,
+    classify_document,
+    extract_document,
+    update_search_vector,
+)
+
+
+class Command(BaseCommand):
+    help = "Extract text from RSMC guidance documents that are missing or changed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", help="Only process rsmc/<year>/")
+        parser.add_argument(
+            "--reindex",
+            action="store_true",
+            help="Re-classify stored rows and rebuild the search index without re-extracting",
+        )
+
+    def handle(self, *args, **options):
+        if options["reindex"]:
+            return self.reindex()
+
+        media_root = Path(settings.MEDIA_ROOT)
+        base = media_root / "rsmc"
+        pattern = f"{options['year']}/*/*/*" if options["year"] else "*/*/*/*"
+
+        current = {
+            (doc.file_path, doc.file_mtime_ns, doc.file_size)
+            for doc in DocumentText.objects.only("file_path", "file_mtime_ns", "file_size")
+        }
+
+        extracted = failed = 0
+
+        # rsmc/<year>/<month>/<day>/<file>; quarterly folders are not guidance
+        for full_path in sorted(base.glob(pattern)):
+            if full_path.parent.parent.name.startswith("quarter_"):
+                continue
+            if not full_path.is_file() or not full_path.name.lower().endswith(DOC_EXTENSIONS):
+                continue
+
+            relative_path = full_path.relative_to(media_root).as_posix()
+            stat = full_path.stat()
+            if (relative_path, stat.st_mtime_ns, stat.st_size) in current:
+                continue
+
+            try:
+                extract_document(relative_path)
+                extracted += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"{relative_path}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Extracted {extracted} document(s), {failed} failed."
+        ))
+
+
+    def reindex(self):
+        documents = list(DocumentText.objects.only("pk", "file_path"))
+        for document in documents:
+            document.issue_date, document.doc_type = classify_document(document.file_path)
+        DocumentText.objects.bulk_update(documents, ["issue_date", "doc_type"], batch_size=500)
+
+        indexed = update_search_vector(DocumentText.objects.all())
+        self.stdout.write(self.style.SUCCESS(
+            f"Re-classified {len(documents)} document(s), indexed {indexed}."
+        ))
@@ -8,7 +8,7 @@ class Command(BaseCommand):
     def handle(self, *args, **kwargs):
         synced = sync_today()
 
-        if synced:
-            self.stdout.write(self.style.SUCCESS("Forecast sync complete."))
+        if synced is None:
+            self.stdout.write(self.style.WARNING("No folder found for today."))
         else:
-            self.stdout.write(self.style.WARNING("No folder found for today."))
\ No newline at end of file
+            self.stdout.write(self.style.SUCCESS(f"Forecast sync complete ({synced} registered)."))
\ No newline at end of file
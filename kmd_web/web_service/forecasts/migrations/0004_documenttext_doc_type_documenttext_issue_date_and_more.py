@@ -0,0 +1,38 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:32
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0003_documenttext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='documenttext',
+            name='doc_type',
+            field=models.CharField(choices=[('discussion', 'Discussion'), ('table', 'Risk / Probability Table'), ('marine', 'Marine Forecast'), ('easwfp', 'EASWFP Discussion'), ('other', 'Other')], default='other', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='documenttext',
+            name='issue_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='documenttext',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='documenttext',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='doctext_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='documenttext',
+            index=models.Index(fields=['doc_type', 'issue_date'], name='forecasts_d_doc_typ_be56b7_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasts', '0004_documenttext_doc_type_documenttext_issue_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='forecast',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['issue_date', 'day'], name='forecast_active_issue'),
+        ),
+    ]
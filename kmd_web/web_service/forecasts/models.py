@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 class ForecastCategory(models.Model):
@@ -76,8 +78,50 @@ class Forecast(models.Model):
                 name='unique_document_forecast'
             ),
         ]
+        indexes = [
+            # Latest-issue lookups: active products by date, newest first
+            models.Index(fields=["issue_date", "day"], name="forecast_active_issue", condition=models.Q(is_active=True)),
+        ]
 
     def __str__(self):
         if self.content_type == 'image':
             return f"{self.category.name} - Day {self.day} ({self.issue_date})"
         return f"{self.get_slug_display()} ({self.issue_date})"
+
+
+class DocumentText(models.Model):
+    """
+    Text extracted once from a guidance document (.doc / .docx / .pdf).
+    Identical files share one extraction through `sha256`; the read path
+    finds the current row from a stat() of the file alone.
+    """
+    DOC_TYPE_CHOICES = [
+        ("discussion", "Discussion"),
+        ("table", "Risk / Probability Table"),
+        ("marine", "Marine Forecast"),
+        ("easwfp", "EASWFP Discussion"),
+        ("other", "Other"),
+    ]
+
+    file_path = models.CharField(max_length=500, unique=True)  # relative to MEDIA_ROOT
+    file_size = models.BigIntegerField()
+    file_mtime_ns = models.BigIntegerField()
+    sha256 = models.CharField(max_length=64, db_index=True)
+
+    # Parsed from rsmc/<year>/<month>/<mon-dd>/<file> for search filters
+    issue_date = models.DateField(null=True, blank=True)
+    doc_type = models.CharField(max_length=20, choices=DOC_TYPE_CHOICES, default="other")
+
+    content = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)  # filled on PostgreSQL only
+    extracted_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["file_path"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="doctext_search_gin"),
+            models.Index(fields=["doc_type", "issue_date"]),
+        ]
+
+    def __str__(self):
+        return self.file_path
@@ -1,7 +1,14 @@
-import textract
 from django.http import JsonResponse
 from django.views import View
 
+from .services.doc_text import (
+    DOC_EXTENSIONS,
+    extraction_error,
+    get_document_text,
+    queue_extraction,
+    resolve_media_path,
+)
+
 class ReadDocView(View):
     def get(self, request):
         file_path = request.GET.get("file")
@@ -9,8 +16,33 @@ class ReadDocView(View):
         if not file_path:
             return JsonResponse({"error": "No file provided"}, status=400)
 
+        # Same rule as download_file: path is relative to MEDIA_ROOT
+        full_path, relative_path = resolve_media_path(file_path)
+        if full_path is None:
+            return JsonResponse({"error": "Invalid file path"}, status=400)
+
+        if not full_path.is_file():
+            return JsonResponse({"error": "File not found"}, status=404)
+
+        if not relative_path.lower().endswith(DOC_EXTENSIONS):
+            return JsonResponse({
+                "error": f"Unsupported document type, expected {', '.join(DOC_EXTENSIONS)}"
+            }, status=400)
+
         try:
-            text = textract.process(file_path).decode("utf-8")
+            # Extracted at ingest time; served from cache / DB
+            text = get_document_text(relative_path)
+
+            if text is None:
+                error = extraction_error(relative_path)
+                if error is not None:
+                    return JsonResponse({"error": f"Could not extract text: {error}"}, status=422)
+
+                # Not ingested yet: extract in Celery, client polls back
+                queue_extraction(relative_path)
+                response = JsonResponse({"status": "processing"}, status=202)
+                response["Retry-After"] = "10"
+                return response
 
             return JsonResponse({
                 "content": text
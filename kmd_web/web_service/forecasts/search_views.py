@@ -0,0 +1,103 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F
+from django.urls import reverse
+from django.utils.http import urlencode
+from django.utils.dateparse import parse_date
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from forecasts.models import DocumentText
+
+MAX_RESULTS = 100
+
+
+def _plain_snippet(content, q, width=160):
+    """Fallback excerpt for non-PostgreSQL databases (dev only)."""
+    index = content.lower().find(q.lower())
+    start = max(index - width // 2, 0) if index >= 0 else 0
+    return content[start:start + width].strip()
+
+
+@api_view(["GET"])
+def search_documents(request):
+    """
+    GET /api/forecasts/search/?q=heavy rainfall lake victoria&from=2025-01-01&to=2025-12-31&type=discussion
+    """
+    q = request.GET.get("q", "").strip()
+    if not q:
+        return Response({"error": "q required"}, status=400)
+
+    filters = {}
+    for param, lookup in (("from", "issue_date__gte"), ("to", "issue_date__lte")):
+        value = request.GET.get(param)
+        if not value:
+            continue
+        parsed = parse_date(value)
+        if parsed is None:
+            return Response({"error": f"Invalid {param} date, use YYYY-MM-DD"}, status=400)
+        filters[lookup] = parsed
+
+    doc_type = request.GET.get("type")
+    if doc_type:
+        valid_types = dict(DocumentText.DOC_TYPE_CHOICES)
+        if doc_type not in valid_types:
+            return Response({
+                "error": f"Invalid type. Available: {', '.join(valid_types)}"
+            }, status=400)
+        filters["doc_type"] = doc_type
+
+    try:
+        limit = max(1, min(int(request.GET.get("limit", 20)), MAX_RESULTS))
+    except ValueError:
+        return Response({"error": "Invalid limit"}, status=400)
+
+    documents = DocumentText.objects.filter(**filters)
+
+    if connection.vendor == "postgresql":
+        query = SearchQuery(q, search_type="websearch", config="english")
+        documents = (
+            documents
+            .filter(search_vector=query)
+            .annotate(
+                rank=SearchRank(F("search_vector"), query),
+                snippet=SearchHeadline(
+                    "content",
+                    query,
+                    config="english",
+                    start_sel="<mark>",
+                    stop_sel="</mark>",
+                    max_words=35,
+                    min_words=15,
+                    max_fragments=2,
+                ),
+            )
+            .only("file_path", "issue_date", "doc_type")
+            .order_by("-rank", "-issue_date")[:limit]
+        )
+    else:
+        documents = (
+            documents
+            .filter(content__icontains=q)
+            .order_by("-issue_date")[:limit]
+        )
+
+    download_url = reverse("forecasts:downoload_file")
+
+    results = []
+    for doc in documents:
+        snippet = getattr(doc, "snippet", None)
+        results.append({
+            "name": doc.file_path.rsplit("/", 1)[-1],
+            "url": f"{download_url}?{urlencode({'path': doc.file_path})}",
+            "date": doc.issue_date.isoformat() if doc.issue_date else None,
+            "type": doc.doc_type,
+            "rank": getattr(doc, "rank", None),
+            "snippet": snippet if snippet is not None else _plain_snippet(doc.content, q),
+        })
+
+    return Response({
+        "query": q,
+        "count": len(results),
+        "results": results,
+    })
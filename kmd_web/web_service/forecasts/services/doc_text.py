@@ -0,0 +1,185 @@
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.core.cache import cache
+from django.db import connection
+
+from forecasts.models import DocumentText
+
+DOC_EXTENSIONS = (".doc", ".docx", ".pdf")
+CACHE_TIMEOUT = 60 * 60 * 24
+# Polls of a document still being extracted don't queue it again
+EXTRACTION_PENDING = 60 * 5
+
+
+def resolve_media_path(file_path):
+    """
+    Resolve a MEDIA_ROOT-relative path. Returns (full_path, relative_path),
+    or (None, None) when the path escapes MEDIA_ROOT.
+    """
+    media_root = Path(settings.MEDIA_ROOT).resolve()
+    full_path = (media_root / file_path).resolve()
+
+    if not full_path.is_relative_to(media_root):
+        return None, None
+
+    return full_path, full_path.relative_to(media_root).as_posix()
+
+
+def _cache_key(relative_path, stat, prefix="doctext"):
+    raw = f"{relative_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    return f"{prefix}:" + hashlib.md5(raw.encode()).hexdigest()
+
+
+def classify_document(relative_path):
+    """
+    (issue_date, doc_type) from rsmc/<year>/<month>/<mon-dd>/<file>,
+    using the same filename rules as the archive endpoints.
+    """
+    parts = relative_path.split("/")
+    name = parts[-1].lower()
+
+    if "marine" in name:
+        doc_type = "marine"
+    elif "easwfp" in name:
+        doc_type = "easwfp"
+    elif "table" in name:
+        doc_type = "table"
+    elif "discussion" in name:
+        doc_type = "discussion"
+    else:
+        doc_type = "other"
+
+    try:
+        issue_date = datetime.strptime(f"{parts[1]}-{parts[3]}", "%Y-%b-%d").date()
+    except (IndexError, ValueError):
+        issue_date = None
+
+    return issue_date, doc_type
+
+
+def update_search_vector(queryset):
+    """Rebuild tsvectors (file name weighted above body); PostgreSQL only."""
+    if connection.vendor != "postgresql":
+        return 0
+    return queryset.update(
+        search_vector=(
+            SearchVector("file_path", weight="A", config="english")
+            + SearchVector("content", weight="B", config="english")
+        )
+    )
+
+
+def file_sha256(full_path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(full_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_document(file_path):
+    """
+    Run textract on a document (once per distinct file content) and store
+    the result. Called from the Celery task at ingest time.
+    """
+    full_path, relative_path = resolve_media_path(file_path)
+    if full_path is None:
+        raise ValueError(f"Invalid file path: {file_path}")
+
+    stat = full_path.stat()
+    sha256 = file_sha256(full_path)
+
+    # Same bytes already extracted (re-save, or an unchanged re-issue)
+    existing = (
+        DocumentText.objects
+        .filter(sha256=sha256)
+        .only("content")
+        .first()
+    )
+
+    if existing:
+        content = existing.content
+    else:
+        import textract
+        content = textract.process(str(full_path)).decode("utf-8", errors="replace")
+
+    issue_date, doc_type = classify_document(relative_path)
+
+    document, _ = DocumentText.objects.update_or_create(
+        file_path=relative_path,
+        defaults={
+            "file_size": stat.st_size,
+            "file_mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "issue_date": issue_date,
+            "doc_type": doc_type,
+            "content": content,
+        }
+    )
+    update_search_vector(DocumentText.objects.filter(pk=document.pk))
+
+    cache.set(_cache_key(relative_path, stat), content, CACHE_TIMEOUT)
+    return document
+
+
+def get_document_text(file_path):
+    """
+    Cached text for a document: cache -> DB row matching mtime/size.
+    Returns None when the current file has not been extracted yet; the
+    caller queues extraction instead of running textract in the request.
+    """
+    full_path, relative_path = resolve_media_path(file_path)
+    if full_path is None:
+        raise ValueError(f"Invalid file path: {file_path}")
+
+    stat = full_path.stat()
+    key = _cache_key(relative_path, stat)
+
+    content = cache.get(key)
+    if content is not None:
+        return content
+
+    document = (
+        DocumentText.objects
+        .filter(
+            file_path=relative_path,
+            file_mtime_ns=stat.st_mtime_ns,
+            file_size=stat.st_size,
+        )
+        .only("content")
+        .first()
+    )
+
+    if document is None:
+        return None
+
+    cache.set(key, document.content, CACHE_TIMEOUT)
+    return document.content
+
+
+def record_extraction_failure(file_path, error):
+    """Remember that this version of the file cannot be extracted."""
+    full_path, relative_path = resolve_media_path(file_path)
+    try:
+        stat = full_path.stat()
+    except (AttributeError, OSError):
+        return
+    cache.set(_cache_key(relative_path, stat, "doctext:failed"), str(error), CACHE_TIMEOUT)
+
+
+def extraction_error(file_path):
+    """The recorded failure for the current file, or None; a changed file is retried."""
+    full_path, relative_path = resolve_media_path(file_path)
+    return cache.get(_cache_key(relative_path, full_path.stat(), "doctext:failed"))
+
+
+def queue_extraction(file_path):
+    """Queue extract_document_text once per EXTRACTION_PENDING window."""
+    from forecasts.tasks import extract_document_text
+
+    if cache.add(f"doctext:pending:{file_path}", True, EXTRACTION_PENDING):
+        extract_document_text.delay(file_path)
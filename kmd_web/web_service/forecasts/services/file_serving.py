@@ -0,0 +1,253 @@
+import hashlib
+import mimetypes
+import os
+import secrets
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import (
+    content_disposition_header,
+    http_date,
+    parse_http_date_safe,
+    quote_etag,
+)
+
+# More ranges than this in one request are ignored and the whole file is sent
+MAX_RANGES = 16
+
+
+def file_validators(path, *extra):
+    """
+    Build (etag, last_modified) for a file from its stat() only.
+    The file itself is never opened. Any `extra` values (e.g. a variable
+    name) are mixed into the ETag for responses derived from the file.
+    """
+    stat = os.stat(path)
+    parts = [f"{stat.st_mtime_ns:x}", f"{stat.st_size:x}", *map(str, extra)]
+    return quote_etag("-".join(parts)), int(stat.st_mtime)
+
+
+def row_validators(obj, timestamp_field="created_at"):
+    """
+    Build (etag, last_modified) for a catalogue row that points at a file
+    (QuarterlyReport, EventTable, ...) without touching the disk.
+    """
+    timestamp = getattr(obj, timestamp_field)
+    raw = f"{obj._meta.label}:{obj.pk}:{obj.file_path}:{timestamp.isoformat()}"
+    etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+    return etag, int(timestamp.timestamp())
+
+
+def set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def not_modified(request, etag, last_modified):
+    """
+    Returns a 304/412 response when the request's If-None-Match /
+    If-Modified-Since headers match, otherwise None.
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def x_accel_location(path):
+    """
+    Map a file on disk to its nginx `internal` location, or None when
+    X-Accel offload is off or the file is outside every mapped root.
+    """
+    if getattr(settings, "FILE_DOWNLOAD_MODE", "django") != "x-accel":
+        return None
+
+    path = os.path.realpath(path)
+    for root, location in getattr(settings, "X_ACCEL_LOCATIONS", {}).items():
+        root = os.path.realpath(root)
+        if os.path.commonpath([path, root]) != root:
+            continue
+        relative = os.path.relpath(path, root).replace(os.sep, "/")
+        return location.rstrip("/") + "/" + quote(relative)
+
+    return None
+
+
+def parse_range_header(header, size):
+    """
+    Parse a `Range: bytes=...` header into sorted, merged (start, end)
+    pairs with inclusive ends.
+
+    Returns None when the header is absent or malformed (send the whole
+    file) and [] when no range is satisfiable (416).
+    """
+    if not header:
+        return None
+
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+
+    ranges = []
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        if not dash:
+            return None
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else size - 1
+                if start < 0 or (last and end < start):
+                    return None
+            else:
+                # suffix range: the last N bytes
+                suffix = int(last)
+                if suffix < 0:
+                    return None
+                start, end = max(size - suffix, 0), size - 1
+                if suffix == 0:
+                    continue
+        except ValueError:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def if_range_matches(request, etag, last_modified):
+    """If-Range: only honour Range when the client's copy is still current."""
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        # strong comparison; weak tags never match
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def read_range(path, start, end, chunk_size=FileResponse.block_size):
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = fh.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def range_response(path, ranges, size, content_type):
+    """206 Partial Content for one range, or multipart/byteranges for several."""
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        response = StreamingHttpResponse(
+            read_range(path, start, end),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+        return response
+
+    boundary = secrets.token_hex(16)
+    parts = [
+        (
+            (
+                f"\r\n--{boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode("ascii"),
+            start,
+            end,
+        )
+        for start, end in ranges
+    ]
+    closing = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+    def stream():
+        for head, start, end in parts:
+            yield head
+            yield from read_range(path, start, end)
+        yield closing
+
+    response = StreamingHttpResponse(
+        stream(),
+        status=206,
+        content_type=f"multipart/byteranges; boundary={boundary}",
+    )
+    length = sum(len(head) + end - start + 1 for head, start, end in parts)
+    response["Content-Length"] = str(length + len(closing))
+    return response
+
+
+def serve_file(request, path, content_type=None, as_attachment=False, filename=""):
+    """
+    FileResponse with ETag / Last-Modified derived from file mtime and size.
+    Conditional requests are answered with 304 before the file is opened,
+    and `Range` requests with 206 (single or multipart/byteranges) or 416.
+
+    With FILE_DOWNLOAD_MODE = "x-accel" the body is left to nginx: the view
+    has already done its validation, the worker only returns headers.
+    """
+    etag, last_modified = file_validators(path)
+
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
+    if content_type is None:
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    disposition = content_disposition_header(
+        as_attachment,
+        filename or os.path.basename(path),
+    )
+
+    location = x_accel_location(path)
+    if location:
+        # nginx handles Range / If-Range itself on the internal location
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = location
+        if disposition:
+            response["Content-Disposition"] = disposition
+        return set_validators(response, etag, last_modified)
+
+    ranges = None
+    if request.method == "GET" and if_range_matches(request, etag, last_modified):
+        size = os.path.getsize(path)
+        ranges = parse_range_header(request.META.get("HTTP_RANGE"), size)
+
+    if ranges == []:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif ranges:
+        response = range_response(path, ranges, size, content_type)
+        if disposition:
+            response["Content-Disposition"] = disposition
+    else:
+        response = FileResponse(
+            open(path, "rb"),
+            content_type=content_type,
+            as_attachment=as_attachment,
+            filename=filename,
+        )
+
+    response["Accept-Ranges"] = "bytes"
+    return set_validators(response, etag, last_modified)
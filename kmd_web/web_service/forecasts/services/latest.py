@@ -0,0 +1,126 @@
+"""
+Today's forecast maps and guidance documents as cached snapshots, read
+from the Forecast rows registered by services.sync (beat, every 5 min),
+with no filesystem probing on the request path.
+Used by the homepage bootstrap endpoint.
+"""
+import os
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q, Subquery
+from django.utils import timezone
+
+from forecasts.doc_views import FILENAME_PATTERNS
+from forecasts.models import Forecast
+from news.services.snapshots import get_snapshot
+
+FORECAST_IMAGES = "forecast-images"
+GUIDANCE_DOCUMENTS = "guidance-documents"
+
+MAX_DAY = 5
+
+
+def next_midnight():
+    """Today's rows stop being "latest" when the date rolls over."""
+    # Same "today" as the ingest and the single-item views: now().date()
+    tomorrow = timezone.now().date() + timedelta(days=1)
+    return datetime.combine(tomorrow, time.min, tzinfo=dt_timezone.utc)
+
+
+def media_url(file_path):
+    return f"{settings.MEDIA_URL}{file_path}"
+
+
+def image_item(forecast):
+    return {
+        "image": media_url(forecast.file_path),
+        "date": forecast.issue_date.strftime("%Y-%m-%d"),
+        "day": forecast.day,
+    }
+
+
+def document_item(forecast):
+    return {
+        "url": media_url(forecast.file_path),
+        "date": forecast.issue_date.strftime("%Y-%m-%d"),
+        "filename": os.path.basename(forecast.file_path),
+        "file_type": os.path.splitext(forecast.file_path)[1].lstrip(".").lower(),
+    }
+
+
+def todays_forecast_images():
+    today = timezone.now().date()
+    forecasts = (
+        Forecast.objects
+        .filter(day__in=range(1, MAX_DAY + 1), issue_date=today, is_active=True)
+        .order_by("day")
+    )
+    return [image_item(forecast) for forecast in forecasts]
+
+
+def todays_guidance_documents(slugs):
+    today = timezone.now().date()
+    forecasts = (
+        Forecast.objects
+        .filter(content_type="document", slug__in=slugs, issue_date=today, is_active=True)
+        .order_by("slug")
+    )
+    return {forecast.slug: document_item(forecast) for forecast in forecasts}
+
+
+def forecast_bundle(requested_date=None):
+    """
+    Day 1-MAX_DAY maps and the guidance documents of one issue date, in a
+    single query. When nothing is registered for `requested_date` (today
+    by default), the most recent earlier issue date is used instead.
+    """
+    requested_date = requested_date or timezone.now().date()
+    products = Q(day__in=range(1, MAX_DAY + 1)) | Q(content_type="document", slug__isnull=False)
+
+    # Correlated into the main query, not a second round trip
+    latest_date = (
+        Forecast.objects
+        .filter(products, is_active=True, issue_date__lte=requested_date)
+        .order_by("-issue_date")
+        .values("issue_date")[:1]
+    )
+    forecasts = list(
+        Forecast.objects
+        .filter(products, is_active=True, issue_date=Subquery(latest_date))
+        .select_related("category")
+        .order_by("day", "slug")
+    )
+
+    issue_date = forecasts[0].issue_date if forecasts else None
+    days, documents = [], {}
+    for forecast in forecasts:
+        if forecast.day:
+            days.append({
+                **image_item(forecast),
+                "title": forecast.title,
+                "category": forecast.category.slug,
+            })
+        else:
+            documents[forecast.slug] = {**document_item(forecast), "title": forecast.title}
+
+    return {
+        "requested_date": requested_date.strftime("%Y-%m-%d"),
+        "date": issue_date.strftime("%Y-%m-%d") if issue_date else None,
+        "is_fallback": issue_date is not None and issue_date != requested_date,
+        "days": days,
+        "missing_days": sorted(set(range(1, MAX_DAY + 1)) - {item["day"] for item in days}),
+        "documents": documents,
+    }
+
+
+def forecast_images_snapshot():
+    return get_snapshot(FORECAST_IMAGES, todays_forecast_images, next_midnight)
+
+
+def guidance_documents_snapshot():
+    return get_snapshot(
+        GUIDANCE_DOCUMENTS,
+        lambda: todays_guidance_documents(list(FILENAME_PATTERNS)),
+        next_midnight,
+    )
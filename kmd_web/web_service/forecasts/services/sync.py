@@ -1,14 +1,38 @@
 import os
-from datetime import date
 from django.conf import settings
+from forecasts.doc_views import FILENAME_PATTERNS
 from forecasts.models import Forecast, ForecastCategory
+from forecasts.services.latest import MAX_DAY
 from django.utils.timezone import now
 
+
+def _register(category, lookup, defaults):
+    """update_or_create, skipped when the row is already current (no save, no signals)."""
+    current = Forecast.objects.filter(
+        category=category,
+        file_path=defaults["file_path"],
+        is_active=True,
+        **lookup,
+    ).exists()
+    if current:
+        return False
+
+    Forecast.objects.update_or_create(category=category, **lookup, defaults=defaults)
+    return True
+
+
 def sync_today():
+    """
+    Register today's map images and guidance documents found under
+    MEDIA_ROOT/rsmc/<year>/<month>/<mon-dd>/ as Forecast rows, which the
+    latest/bootstrap endpoints read. Returns the number of rows added or
+    updated, or None when today's folder does not exist yet.
+    """
     today = now().date()
 
     year = str(today.year)
-    month = today.strftime("%B").lower()
+    month_title = today.strftime("%B")
+    month = month_title.lower()
     day_folder = today.strftime("%b-%d").lower()
 
     base_path = os.path.join(
@@ -20,31 +44,49 @@ def sync_today():
     )
 
     if not os.path.exists(base_path):
-        return False  # Nothing to sync
+        return None  # Nothing to sync
+
+    files = set(os.listdir(base_path))
+    registered = 0
 
     short_range, _ = ForecastCategory.objects.get_or_create(
         slug="short-range",
         defaults={"name": "Short Range"}
     )
 
-    files = os.listdir(base_path)
-
-    for day in range(1, 6):
+    for day in range(1, MAX_DAY + 1):
         image_name = f"rsmc0{day}.jpg"
         if image_name not in files:
             continue
 
-        relative_path = f"rsmc/{year}/{month}/{day_folder}/{image_name}"
-
-        Forecast.objects.update_or_create(
-            category=short_range,
-            day=day,
-            issue_date=today,
-            defaults={
+        registered += _register(
+            short_range,
+            {"content_type": "image", "day": day, "issue_date": today},
+            {
                 "title": f"Short Range Forecast - Day {day}",
-                "map_image": relative_path,
+                "file_path": f"rsmc/{year}/{month}/{day_folder}/{image_name}",
+                "is_active": True,
+            },
+        )
+
+    guidance, _ = ForecastCategory.objects.get_or_create(
+        slug="guidance",
+        defaults={"name": "Guidance Documents"}
+    )
+
+    for slug, filename_for in FILENAME_PATTERNS.items():
+        filename = filename_for(today.strftime("%d"), month_title, today.year)
+        if filename not in files:
+            continue
+
+        registered += _register(
+            guidance,
+            {"content_type": "document", "slug": slug, "issue_date": today},
+            {
+                "title": slug.replace("-", " ").title(),
+                "file_path": f"rsmc/{year}/{month}/{day_folder}/{filename}",
                 "is_active": True,
-            }
+            },
         )
 
-    return True
\ No newline at end of file
+    return registered
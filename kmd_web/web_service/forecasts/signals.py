@@ -0,0 +1,45 @@
+#forecasts/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from news.services.snapshots import invalidate_snapshot
+from notifications.services.channel import publish_on_commit
+
+from .models import Forecast
+from .services.doc_text import DOC_EXTENSIONS
+from .services.latest import FORECAST_IMAGES, GUIDANCE_DOCUMENTS
+from .tasks import extract_document_text
+
+
+@receiver(post_save, sender=Forecast)
+def queue_document_extraction(sender, instance, **kwargs):
+    """Extract guidance text when the document is registered, not when it is read."""
+    if not instance.file_path.lower().endswith(DOC_EXTENSIONS):
+        return
+
+    file_path = instance.file_path
+    transaction.on_commit(lambda: extract_document_text.delay(file_path))
+
+
+@receiver(post_save, sender=Forecast)
+def push_forecast_published(sender, instance, created, **kwargs):
+    if not created or not instance.is_active:
+        return
+
+    publish_on_commit("forecasts", "published", {
+        "id": instance.pk,
+        "category": instance.category_id,
+        "content_type": instance.content_type,
+        "day": instance.day,
+        "slug": instance.slug,
+        "title": instance.title,
+        "issue_date": instance.issue_date,
+        "file_path": instance.file_path,
+    })
+
+
+@receiver(post_save, sender=Forecast)
+@receiver(post_delete, sender=Forecast)
+def refresh_latest_forecasts(sender, instance, **kwargs):
+    invalidate_snapshot(FORECAST_IMAGES if instance.day else GUIDANCE_DOCUMENTS)
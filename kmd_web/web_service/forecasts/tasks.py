@@ -0,0 +1,27 @@
+#forecasts/tasks.py
+from celery import shared_task
+from .services.doc_text import extract_document, record_extraction_failure
+from .services.sync import sync_today
+
+
+EXTRACT_MAX_RETRIES = 3
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': EXTRACT_MAX_RETRIES})
+def extract_document_text(self, file_path):
+    try:
+        document = extract_document(file_path)
+    except Exception as exc:
+        if self.request.retries >= EXTRACT_MAX_RETRIES:
+            # Last attempt: read-doc answers 422 instead of "processing" forever
+            record_extraction_failure(file_path, exc)
+        raise
+    return f"Extracted {document.file_path} ({len(document.content)} chars)"
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
+def sync_todays_forecasts(self):
+    registered = sync_today()
+    if registered is None:
+        return "No folder for today yet"
+    return f"Registered {registered} forecast(s)"
@@ -1,3 +1,63 @@
-from django.test import TestCase
+import os
+import tempfile
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .services.file_serving import MAX_RANGES, parse_range_header, range_response
+
+
+class ParseRangeHeaderTests(SimpleTestCase):
+    def test_absent_or_malformed_means_whole_file(self):
+        for header in (None, "", "items=0-1", "bytes=", "bytes=5", "bytes=a-b", "bytes=5-2", "bytes=-x"):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range_header(header, 100))
+
+    def test_closed_open_and_suffix_ranges(self):
+        self.assertEqual(parse_range_header("bytes=0-9", 100), [(0, 9)])
+        self.assertEqual(parse_range_header("bytes=90-", 100), [(90, 99)])
+        self.assertEqual(parse_range_header("bytes=-10", 100), [(90, 99)])
+
+    def test_ends_are_clamped_to_the_file(self):
+        self.assertEqual(parse_range_header("bytes=95-500", 100), [(95, 99)])
+        self.assertEqual(parse_range_header("bytes=-500", 100), [(0, 99)])
+
+    def test_unsatisfiable_ranges_are_empty(self):
+        self.assertEqual(parse_range_header("bytes=100-", 100), [])
+        self.assertEqual(parse_range_header("bytes=-0", 100), [])
+        self.assertEqual(parse_range_header("bytes=0-", 0), [])
+
+    def test_overlapping_and_adjacent_ranges_are_merged_in_order(self):
+        self.assertEqual(
+            parse_range_header("bytes=50-59, 0-9,10-19,55-70", 100),
+            [(0, 19), (50, 70)],
+        )
+
+    def test_too_many_ranges_means_whole_file(self):
+        header = "bytes=" + ",".join(f"{n * 2}-{n * 2}" for n in range(MAX_RANGES + 1))
+        self.assertIsNone(parse_range_header(header, 1000))
+
+
+class RangeResponseTests(SimpleTestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(bytes(range(100)))
+        self.addCleanup(os.unlink, self.path)
+
+    def test_single_range(self):
+        response = range_response(self.path, [(10, 19)], 100, "application/octet-stream")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/100")
+        self.assertEqual(b"".join(response.streaming_content), bytes(range(10, 20)))
+        self.assertEqual(response["Content-Length"], "10")
+
+    def test_multiple_ranges_are_multipart_with_exact_length(self):
+        response = range_response(self.path, [(0, 1), (98, 99)], 100, "image/png")
+
+        body = b"".join(response.streaming_content)
+        boundary = response["Content-Type"].split("boundary=")[1]
+        self.assertTrue(response["Content-Type"].startswith("multipart/byteranges"))
+        self.assertEqual(int(response["Content-Length"]), len(body))
+        self.assertIn(b"Content-Range: bytes 98-99/100\r\n\r\n" + bytes([98, 99]), body)
+        self.assertTrue(body.endswith(f"\r\n--{boundary}--\r\n".encode()))
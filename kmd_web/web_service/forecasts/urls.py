@@ -2,15 +2,18 @@
 from django.urls import path
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from .views import latest_forecast
+from .views import latest_forecast, latest_forecasts
 from .doc_views import guidance_documents
 from .guidance_archive_views import guidance_files
 from .archive_views import list_years, list_months, list_days, list_files, archive_files  # Added archive_files
 from .download_files import download_file
+from .read_doc import ReadDocView
+from .search_views import search_documents
 app_name = "forecasts"
 
 urlpatterns = [
     path("latest/", latest_forecast, name="latest-forecast"),  # Images ?day=1
+    path("latest/all/", latest_forecasts, name="latest-forecasts"),  # Days 1-5 + docs ?date=YYYY-MM-DD
     path('latest-doc/', guidance_documents, name='latest-document'),  # Docs ?slug=short-discussion
     path("archive/years/", list_years, name="archive-years"),
     path("archive/months/", list_months, name="archive-months"),
@@ -19,6 +22,8 @@ urlpatterns = [
     path("guidance_archive/files/", guidance_files, name="guidance_archive-files"),  # OLD: all files
     path("archive/filtered-files/", archive_files, name="archive-filtered-files"),  # NEW: type-filtered files
     path("download/", download_file, name="downoload_file"),
+    path("read-doc/", ReadDocView.as_view(), name="read-doc"),  # Extracted text ?file=rsmc/...
+    path("search/", search_documents, name="search-documents"),  # ?q=&from=&to=&type=
 
    
 ]
@@ -3,10 +3,10 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from django.conf import settings
 from forecasts.models import Forecast, ForecastCategory
+from forecasts.services.latest import MAX_DAY, forecast_bundle
+from datetime import datetime
 import os
 
-MAX_DAY = 5
-
 
 @api_view(["GET"])
 def latest_forecast(request):
@@ -81,4 +81,25 @@ def latest_forecast(request):
         "image": forecast.file_path,
         "date": forecast.issue_date.strftime("%Y-%m-%d"),
         "day": day_int
-    })
\ No newline at end of file
+    })
+
+
+@api_view(["GET"])
+def latest_forecasts(request):
+    """
+    All day 1-MAX_DAY maps plus the guidance documents for one issue date
+    (?date=YYYY-MM-DD, default today), falling back to the most recent
+    earlier issue date. Replaces one latest_forecast call per day.
+    """
+    requested_date = None
+    if request.GET.get("date"):
+        try:
+            requested_date = datetime.strptime(request.GET["date"], "%Y-%m-%d").date()
+        except ValueError:
+            return Response({"error": "Invalid date, expected YYYY-MM-DD"}, status=400)
+
+    bundle = forecast_bundle(requested_date)
+    if bundle["date"] is None:
+        return Response({"error": "No forecasts available"}, status=404)
+
+    return Response(bundle)
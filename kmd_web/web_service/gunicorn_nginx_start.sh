@@ -33,11 +33,24 @@ SOCKET_FILE="$PROJECT_DIR/web_service.sock"
 GUNICORN_SERVICE="gunicorn"
 GUNICORN_UNIT="/etc/systemd/system/$GUNICORN_SERVICE.service"
 
+# Long-lived Server-Sent Events connections (notifications app) run on
+# the ASGI app so they don't pin gunicorn's sync workers
+UVICORN_BIN="$VENV_DIR/bin/uvicorn"
+ASGI_SOCKET_FILE="$PROJECT_DIR/web_service_asgi.sock"
+ASGI_SERVICE="rsmc-asgi"
+ASGI_UNIT="/etc/systemd/system/$ASGI_SERVICE.service"
+
 NGINX_CONF="/etc/nginx/sites-available/rsmc.conf"
 NGINX_LINK="/etc/nginx/sites-enabled/rsmc.conf"
+# Any location with its own add_header drops the server-level ones, so
+# those locations include this snippet again
+NGINX_SECURITY_HEADERS="/etc/nginx/snippets/rsmc_security_headers.conf"
 
 FRONTEND_DIR="$HOME_DIR/kmd/kmd_web/web_front/client/dist"
 
+# Must match PUBLISHED_JSON_ROOT in the Django settings
+PUBLISHED_DIR="${PUBLISHED_JSON_ROOT:-/var/www/rsmc/published}"
+
 # --------------------------------------------------
 # Check nginx installed
 # --------------------------------------------------
@@ -65,6 +78,10 @@ echo "✅ nginx and gunicorn detected"
 mkdir -p /var/log/gunicorn
 chown $USER_NAME:$USER_NAME /var/log/gunicorn
 
+# Written by Django (publish_pages / signals), read by nginx
+mkdir -p "$PUBLISHED_DIR"
+chown $USER_NAME:$USER_NAME "$PUBLISHED_DIR"
+
 # --------------------------------------------------
 # Create gunicorn service (with TimeoutStartSec)
 # --------------------------------------------------
@@ -78,6 +95,9 @@ User=$USER_NAME
 Group=www-data
 WorkingDirectory=$PROJECT_DIR
 
+# Django validates downloads, nginx sends the bytes (X-Accel-Redirect)
+Environment=FILE_DOWNLOAD_MODE=x-accel
+
 ExecStart=$GUNICORN_BIN \
           --workers 3 \
           --bind unix:$SOCKET_FILE \
@@ -104,9 +124,52 @@ systemctl restart $GUNICORN_SERVICE || true
 
 echo "✅ Created $GUNICORN_UNIT, TimeoutStartSec=30 and reloaded systemd"
 
+# --------------------------------------------------
+# Create ASGI (uvicorn) service for the push channel
+# --------------------------------------------------
+cat > "$ASGI_UNIT" <<EOL
+[Unit]
+Description=Uvicorn (ASGI) for RSMC push notifications
+After=network.target redis-server.service
+
+[Service]
+User=$USER_NAME
+Group=www-data
+WorkingDirectory=$PROJECT_DIR
+
+ExecStart=$UVICORN_BIN \
+          --uds $ASGI_SOCKET_FILE \
+          --workers 2 \
+          --timeout-graceful-shutdown 5 \
+          rsmc_config.config.asgi:application
+
+Restart=always
+RestartSec=5
+
+LimitNOFILE=65535
+PrivateTmp=true
+
+[Install]
+WantedBy=multi-user.target
+EOL
+
+systemctl daemon-reload
+
+echo "✅ Created $ASGI_UNIT"
+
 # --------------------------------------------------
 # Create nginx config
 # --------------------------------------------------
+mkdir -p "$(dirname "$NGINX_SECURITY_HEADERS")"
+cat > "$NGINX_SECURITY_HEADERS" <<EOL
+add_header X-Frame-Options SAMEORIGIN;
+add_header X-Content-Type-Options nosniff;
+add_header X-XSS-Protection "1; mode=block";
+add_header Strict-Transport-Security "max-age=31536000; includeSubDomains; preload" always;
+EOL
+
+echo "✅ Created $NGINX_SECURITY_HEADERS"
+
 cat > "$NGINX_CONF" <<EOL
 # Redirect HTTP to HTTPS
 server {
@@ -134,10 +197,7 @@ server {
     ssl_prefer_server_ciphers on;
 
     # Security headers
-    add_header X-Frame-Options SAMEORIGIN;
-    add_header X-Content-Type-Options nosniff;
-    add_header X-XSS-Protection "1; mode=block";
-    add_header Strict-Transport-Security "max-age=31536000; includeSubDomains; preload" always;
+    include $NGINX_SECURITY_HEADERS;
 
     # -----------------------------
     # Frontend (React build)
@@ -157,11 +217,54 @@ server {
         proxy_pass http://unix:$SOCKET_FILE;
     }
 
+    # Server-Sent Events: ASGI app, unbuffered, long-lived
+    location /api/notifications/ {
+        include proxy_params;
+        proxy_pass http://unix:$ASGI_SOCKET_FILE;
+        proxy_http_version 1.1;
+        proxy_set_header Connection "";
+        proxy_buffering off;
+        proxy_cache off;
+        proxy_read_timeout 1h;
+        gzip off;
+    }
+
     location /admin/ {
         include proxy_params;
         proxy_pass http://unix:$SOCKET_FILE;
     }
 
+    # CMS JSON published on save (pages.services.published); Django only
+    # answers when the file has not been rendered yet
+    location ~ ^/api/pages/(?<page_slug>[-\w]+)/?\$ {
+        root $PUBLISHED_DIR;
+        default_type application/json;
+        try_files /pages/\$page_slug.json @django;
+        include $NGINX_SECURITY_HEADERS;
+        add_header Cache-Control "public, max-age=300";
+    }
+
+    location ~ ^/api/home/(?<home_slug>[-\w]+)/?\$ {
+        root $PUBLISHED_DIR;
+        default_type application/json;
+        try_files /home/\$home_slug.json @django;
+        include $NGINX_SECURITY_HEADERS;
+        add_header Cache-Control "public, max-age=300";
+    }
+
+    location = /api/home/ {
+        root $PUBLISHED_DIR;
+        default_type application/json;
+        try_files /home-list.json @django;
+        include $NGINX_SECURITY_HEADERS;
+        add_header Cache-Control "public, max-age=300";
+    }
+
+    location @django {
+        include proxy_params;
+        proxy_pass http://unix:$SOCKET_FILE;
+    }
+
     # -----------------------------
     # Static files
     # -----------------------------
@@ -184,6 +287,28 @@ server {
         autoindex off;
         access_log off;
     }
+
+    # -----------------------------
+    # X-Accel-Redirect targets (only reachable from Django responses)
+    # -----------------------------
+    location /protected/uploads/ {
+        internal;
+        alias /home/$USER_NAME/uploads/;
+        sendfile on;
+        tcp_nopush on;
+    }
+
+    location /protected/maps/ {
+        internal;
+        alias $HOME_DIR/kmd/generated_maps/;
+        sendfile on;
+        tcp_nopush on;
+
+        # custom upstream headers are dropped on internal redirect
+        include $NGINX_SECURITY_HEADERS;
+        add_header X-Domain-Bounds \$upstream_http_x_domain_bounds;
+        add_header Access-Control-Expose-Headers X-Domain-Bounds;
+    }
     # Optional gzip
         gzip on;
         gzip_types text/plain application/javascript application/json text/css image/svg+xml;
@@ -225,6 +350,7 @@ systemctl daemon-reload
 # Start gunicorn
 # --------------------------------------------------
 systemctl enable --now $GUNICORN_SERVICE
+systemctl enable --now $ASGI_SERVICE
 
 # --------------------------------------------------
 # Reload nginx
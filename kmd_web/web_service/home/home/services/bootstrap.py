@@ -0,0 +1,59 @@
+"""
+Everything the SPA homepage needs for its first paint in one response.
+
+Each section is a cached snapshot (see news.services.snapshots, and
+pages.services.published for home content) that is rebuilt only when
+its rows change or its time window moves, so a warm bootstrap request
+is a handful of cache reads and no SQL.
+"""
+import hashlib
+
+from forecasts.services.latest import forecast_images_snapshot, guidance_documents_snapshot
+from home.home.services.content import home_list_entry
+from news.services.feeds import (
+    active_announcements_snapshot,
+    active_warnings_snapshot,
+    latest_news_snapshot,
+    upcoming_events_snapshot,
+)
+
+
+# section name -> snapshot getter, in the order the homepage renders them
+SECTIONS = {
+    "warnings": active_warnings_snapshot,
+    "announcements": active_announcements_snapshot,
+    "home": home_list_entry,
+    "forecasts": forecast_images_snapshot,
+    "guidance": guidance_documents_snapshot,
+    "news": latest_news_snapshot,
+    "events": upcoming_events_snapshot,
+}
+
+
+def build_bootstrap(names=None, known_etags=()):
+    """
+    {"etag", "last_modified", "sections": {name: {"etag", "data"}}}.
+
+    Sections whose ETag is in `known_etags` (the client already holds
+    them) are sent as {"etag", "unchanged": true} without their data.
+    """
+    names = [name for name in (names or SECTIONS) if name in SECTIONS]
+    known = {etag.strip('"') for etag in known_etags}
+
+    sections = {}
+    last_modified = 0
+    for name in names:
+        snapshot = SECTIONS[name]()
+        last_modified = max(last_modified, snapshot["last_modified"])
+        if snapshot["etag"].strip('"') in known:
+            sections[name] = {"etag": snapshot["etag"], "unchanged": True}
+        else:
+            sections[name] = {"etag": snapshot["etag"], "data": snapshot["data"]}
+
+    combined = "|".join(f"{name}={section['etag']}" for name, section in sections.items())
+    combined += "|known=" + ",".join(sorted(known))
+    return {
+        "etag": '"%s"' % hashlib.md5(combined.encode()).hexdigest(),
+        "last_modified": last_modified,
+        "sections": sections,
+    }
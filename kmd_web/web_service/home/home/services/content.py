@@ -0,0 +1,23 @@
+"""Home entries published as JSON (see pages.services.published)."""
+from home.home.models import Home
+from home.home.serializers import HomeSerializer
+from pages.services.published import get_published
+
+HOME_LIST_PATH = "home-list"
+
+
+def home_path(slug):
+    return f"home/{slug}"
+
+
+def render_home(slug):
+    home = Home.objects.filter(slug=slug, is_published=True).first()
+    return HomeSerializer(home).data if home else None
+
+
+def render_home_list():
+    return HomeSerializer(Home.objects.filter(is_published=True), many=True).data
+
+
+def home_list_entry():
+    return get_published(HOME_LIST_PATH, render_home_list)
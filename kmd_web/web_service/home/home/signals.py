@@ -0,0 +1,46 @@
+#home/home/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from pages.services.published import publish, unpublish
+
+from .models import Home
+from .services.content import HOME_LIST_PATH, home_path, render_home, render_home_list
+
+
+@receiver(pre_save, sender=Home)
+def remember_home_slug(sender, instance, **kwargs):
+    instance._published_slug = (
+        Home.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Home)
+def publish_home(sender, instance, **kwargs):
+    """Re-render the entry and the list once per edit, not per request."""
+    old_slug, slug = getattr(instance, "_published_slug", None), instance.slug
+
+    def refresh():
+        if old_slug and old_slug != slug:
+            unpublish(home_path(old_slug))
+        data = render_home(slug)  # None once unpublished
+        if data is None:
+            unpublish(home_path(slug))
+        else:
+            publish(home_path(slug), data)
+        publish(HOME_LIST_PATH, render_home_list())
+
+    transaction.on_commit(refresh)
+
+
+@receiver(post_delete, sender=Home)
+def unpublish_home(sender, instance, **kwargs):
+    slug = instance.slug
+
+    def refresh():
+        unpublish(home_path(slug))
+        publish(HOME_LIST_PATH, render_home_list())
+
+    transaction.on_commit(refresh)
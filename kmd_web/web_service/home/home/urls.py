@@ -1,10 +1,11 @@
 from django.urls import path
 from .views import HomeDetailView, HomeListView
-from .views import health
+from .views import bootstrap, health
 
 urlpatterns = [
     path("home/", HomeListView.as_view(), name="home-list"),
     path("home/<slug:slug>/", HomeDetailView.as_view(), name="home-detail"),
     path("health/", health, name="health"),
+    path("bootstrap/", bootstrap, name="bootstrap"),
     #path("pages/<slug:slug>/", page_detail),
 ]
@@ -1,14 +1,21 @@
 from django.shortcuts import render
 
+from django.utils.cache import patch_cache_control
+from rest_framework.decorators import api_view, permission_classes
 from rest_framework.generics import RetrieveAPIView, ListAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from django.http import JsonResponse
 
 from .models import Home
 from .serializers import HomeSerializer
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404
 from .models import Page
+from .services.bootstrap import SECTIONS, build_bootstrap
+from .services.content import home_list_entry, home_path, render_home
+from pages.services.published import get_published, published_response
+from forecasts.services.file_serving import not_modified, set_validators
 
 class HomeDetailView(RetrieveAPIView):
     serializer_class = HomeSerializer
@@ -18,6 +25,14 @@ class HomeDetailView(RetrieveAPIView):
     def get_queryset(self):
         return Home.objects.filter(is_published=True)
 
+    # Published JSON (nginx serves the file; this is the cached fallback)
+    def retrieve(self, request, *args, **kwargs):
+        slug = kwargs[self.lookup_field]
+        entry = get_published(home_path(slug), lambda: render_home(slug))
+        if entry is None:
+            raise Http404
+        return published_response(request, entry)
+
 
 class HomeListView(ListAPIView):
     serializer_class = HomeSerializer
@@ -26,7 +41,46 @@ class HomeListView(ListAPIView):
     def get_queryset(self):
         return Home.objects.filter(is_published=True)
 
+    def list(self, request, *args, **kwargs):
+        return published_response(request, home_list_entry())
+
 def health(request):
     return JsonResponse({"status": "ok"})
 
 
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def bootstrap(request):
+    """
+    Homepage sections in one round trip: warnings, announcements, home
+    content, today's forecast maps and guidance documents, latest news
+    and upcoming events.
+
+    ?sections=warnings,news   only these sections
+    ?known=<etag>,<etag>      sections the client already has are sent
+                              without their data ("unchanged": true)
+    """
+    # 1️⃣ Parse params
+    names = None
+    if request.GET.get("sections"):
+        names = [name.strip() for name in request.GET["sections"].split(",")]
+        unknown = [name for name in names if name not in SECTIONS]
+        if unknown:
+            return Response({
+                "error": f"Unknown section(s): {', '.join(unknown)}. Available: {', '.join(SECTIONS)}"
+            }, status=400)
+
+    known = [etag for etag in request.GET.get("known", "").split(",") if etag]
+
+    # 2️⃣ Gather the cached snapshots
+    payload = build_bootstrap(names, known)
+    etag, last_modified = payload["etag"], payload["last_modified"]
+
+    # 3️⃣ Conditional response
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        response = set_validators(Response(payload["sections"]), etag, last_modified)
+
+    # Warnings can change at any moment: cache, but always revalidate
+    patch_cache_control(response, no_cache=True)
+    return response
@@ -1,21 +1,20 @@
 from rest_framework import generics
-from .alerts_models import Warning
 from .serializers import WarningSerializer
-from django.utils import timezone
-from django.db import models
+from .services.feeds import active_warnings_queryset, active_warnings_snapshot
+from .services.snapshots import snapshot_response
 
 class ActiveWarningList(generics.ListAPIView):
     """
     Returns all currently active warnings.
+
+    Served from a snapshot that is rebuilt only when a Warning is saved or
+    deleted, or when the next start_at / end_at passes; polls that send
+    If-None-Match get a 304 without touching the database.
     """
     serializer_class = WarningSerializer
 
     def get_queryset(self):
-        now = timezone.now()
-        return Warning.objects.filter(
-            is_active=True
-        ).filter(
-            start_at__lte=now
-        ).filter(
-            models.Q(end_at__gte=now) | models.Q(end_at__isnull=True)
-        ).order_by("-priority", "-start_at")
\ No newline at end of file
+        return active_warnings_queryset()
+
+    def list(self, request, *args, **kwargs):
+        return snapshot_response(request, active_warnings_snapshot())
@@ -1,6 +1,6 @@
 from django.db import models
 from django.utils import timezone
-from django.utils.text import slugify
+from news.services.slugs import unique_slug
 
 
 class Warning(models.Model):
@@ -29,18 +29,25 @@ class Warning(models.Model):
     class Meta:
         ordering = ["-priority", "-start_at"]
         verbose_name_plural = "warnings"
+        indexes = [
+            models.Index(
+                fields=["start_at", "end_at"],
+                condition=models.Q(is_active=True),
+                name="warning_active_window",
+            ),
+            models.Index(
+                fields=["end_at"],
+                condition=models.Q(is_active=True),
+                name="warning_active_end",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({'Active' if self.is_active else 'Inactive'})"
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
-            original = self.slug
-            count = 1
-            while Warning.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original}-{count}"
-                count += 1
+            self.slug = unique_slug(self, self.title)
         super().save(*args, **kwargs)
 
     @property
@@ -1,6 +1,6 @@
 # models.py
 from django.db import models
-from django.utils.text import slugify
+from news.services.slugs import unique_slug
 from django.utils import timezone
 
 
@@ -21,6 +21,14 @@ class Event(models.Model):
 
     class Meta:
         ordering = ["start_date"]
+        indexes = [
+            # Upcoming events: is_active, start_date >= now, ORDER BY start_date
+            models.Index(
+                fields=["start_date"],
+                condition=models.Q(is_active=True),
+                name="event_active_start",
+            ),
+        ]
 
     def __str__(self):
         return self.title
@@ -28,13 +36,6 @@ class Event(models.Model):
     def save(self, *args, **kwargs):
 
         if not self.slug:
-            self.slug = slugify(self.title)
-
-            original = self.slug
-            count = 1
-
-            while Event.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original}-{count}"
-                count += 1
+            self.slug = unique_slug(self, self.title)
 
         super().save(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from news.models import News
+from news.tasks import generate_news_image_variants
+
+
+class Command(BaseCommand):
+    help = "Queue WebP/AVIF variant generation for news images that have none (or --force for all)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Re-queue every news image, e.g. after WIDTHS changes")
+        parser.add_argument("--sync", action="store_true", help="Run in this process instead of queueing Celery tasks")
+
+    def handle(self, *args, **options):
+        news_items = News.objects.exclude(image="").exclude(image__isnull=True).only("id", "image", "image_variants")
+
+        queued = 0
+        for news in news_items.iterator():
+            if not options["force"] and news.image_variants.get("source") == news.image.name:
+                continue
+            if options["sync"]:
+                generate_news_image_variants.apply(args=(news.pk,), throw=True)
+            else:
+                generate_news_image_variants.delay(news.pk)
+            queued += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {queued} news image(s)."))
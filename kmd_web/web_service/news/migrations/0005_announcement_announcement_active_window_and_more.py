@@ -0,0 +1,33 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0004_event'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_at', 'end_at'], name='announcement_active_window'),
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['end_at'], name='announcement_active_end'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_date'], name='event_active_start'),
+        ),
+        migrations.AddIndex(
+            model_name='warning',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['start_at', 'end_at'], name='warning_active_window'),
+        ),
+        migrations.AddIndex(
+            model_name='warning',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['end_at'], name='warning_active_end'),
+        ),
+    ]
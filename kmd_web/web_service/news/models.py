@@ -1,6 +1,6 @@
 from django.db import models
 from django.utils import timezone
-from django.utils.text import slugify
+from news.services.slugs import unique_slug
 
 class News(models.Model):
     title = models.CharField(max_length=255)
@@ -12,6 +12,9 @@ class News(models.Model):
     # Optional / improved
     author = models.CharField(max_length=100, blank=True)
     image = models.ImageField(upload_to="news/%Y/%m/", blank=True, null=True)
+    # Resized WebP/AVIF copies of `image`, filled in by a Celery task:
+    # {"source": name, "width": w, "height": h, "webp": {"320": path, ...}, "avif": {...}}
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     
     # Very useful additions
     created_at = models.DateTimeField(auto_now_add=True)
@@ -30,13 +33,7 @@ class News(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Optional: handle duplicate slugs
-            original = self.slug
-            count = 1
-            while News.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original}-{count}"
-                count += 1
+            self.slug = unique_slug(self, self.title)
         super().save(*args, **kwargs)
 
 
@@ -56,19 +53,27 @@ class Announcement(models.Model):
     class Meta:
         ordering = ["-priority", "-start_at"]
         verbose_name_plural = "announcements"
+        indexes = [
+            # Active-window lookups (start_at <= now, end_at >= now / null)
+            # and next start/end boundary; inactive rows are never read
+            models.Index(
+                fields=["start_at", "end_at"],
+                condition=models.Q(is_active=True),
+                name="announcement_active_window",
+            ),
+            models.Index(
+                fields=["end_at"],
+                condition=models.Q(is_active=True),
+                name="announcement_active_end",
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({'Active' if self.is_active else 'Inactive'})"
     
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Optional: handle duplicate slugs
-            original = self.slug
-            count = 1
-            while News.objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original}-{count}"
-                count += 1
+            self.slug = unique_slug(self, self.title)
         super().save(*args, **kwargs)
     @property
     def is_currently_active(self):
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class NewsCursorPagination(CursorPagination):
+    """
+    Keyset pagination on (published_at, id): each page is an index range
+    scan on (is_published, published_at), however deep the archive, and
+    pages stay stable while new articles are published.
+    """
+    ordering = ("-published_at", "-id")
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
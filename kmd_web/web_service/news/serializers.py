@@ -1,3 +1,4 @@
+from django.core.files.storage import default_storage
 from rest_framework import serializers
 from .models import News, Announcement
 from .alerts_models import Warning
@@ -5,6 +6,8 @@ from .event_models import Event
 
 class NewsSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
+    image_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = News
@@ -17,14 +20,75 @@ class NewsSerializer(serializers.ModelSerializer):
             "is_published",
             "author",
             "image_url",
+            "image_variants",
+            "image_srcset",
         ]
 
     def get_image_url(self, obj):
         request = self.context.get("request")
         if obj.image:
-            return request.build_absolute_uri(obj.image.url)
+            return request.build_absolute_uri(obj.image.url) if request else obj.image.url
         return None
 
+    def _variant_url(self, name):
+        request = self.context.get("request")
+        url = default_storage.url(name)
+        return request.build_absolute_uri(url) if request else url
+
+    def _current_variants(self, obj):
+        # Ignore variants of a previous image until the task catches up
+        variants = obj.image_variants or {}
+        if not obj.image or variants.get("source") != obj.image.name:
+            return None
+        return variants
+
+    def get_image_variants(self, obj):
+        """{"width", "height", "webp": {"320": url, ...}, "avif": {...}}"""
+        variants = self._current_variants(obj)
+        if variants is None:
+            return None
+
+        sizes = {"width": variants["width"], "height": variants["height"]}
+        for fmt, names in variants.items():
+            if isinstance(names, dict):
+                sizes[fmt] = {width: self._variant_url(name) for width, name in names.items()}
+        return sizes
+
+    def get_image_srcset(self, obj):
+        """{"webp": "url 320w, url 640w", ...}, ready for <source srcset>."""
+        variants = self._current_variants(obj)
+        if variants is None:
+            return None
+
+        return {
+            fmt: ", ".join(
+                f"{self._variant_url(name)} {width}w"
+                for width, name in sorted(names.items(), key=lambda item: int(item[0]))
+            )
+            for fmt, names in variants.items()
+            if isinstance(names, dict)
+        }
+
+
+class NewsListSerializer(NewsSerializer):
+    """
+    NewsSerializer without `content`, for the paginated list. `?fields=`
+    (comma-separated) trims the output further, e.g. ?fields=id,title,slug.
+    """
+
+    class Meta(NewsSerializer.Meta):
+        fields = [name for name in NewsSerializer.Meta.fields if name != "content"]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        requested = request.query_params.get("fields") if request else None
+        if requested:
+            wanted = {name.strip() for name in requested.split(",")}
+            for name in set(self.fields) - wanted:
+                self.fields.pop(name)
+
 
 class AnnouncementSerializer(serializers.ModelSerializer):
     class Meta:
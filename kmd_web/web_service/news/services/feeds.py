@@ -0,0 +1,103 @@
+from django.db.models import Min, Q
+from django.utils import timezone
+
+from news.alerts_models import Warning
+from news.event_models import Event
+from news.models import Announcement, News
+from news.serializers import AnnouncementSerializer, EventSerializer, NewsListSerializer, WarningSerializer
+from news.services.snapshots import get_snapshot
+
+ACTIVE_WARNINGS = "active-warnings"
+ACTIVE_ANNOUNCEMENTS = "active-announcements"
+UPCOMING_EVENTS = "upcoming-events"
+LATEST_NEWS = "latest-news"
+
+UPCOMING_EVENTS_LIMIT = 5
+LATEST_NEWS_LIMIT = 10
+
+
+def active_window_queryset(model, now=None):
+    """is_active rows whose start_at <= now <= end_at (open-ended if null)."""
+    now = now or timezone.now()
+    return (
+        model.objects
+        .filter(is_active=True, start_at__lte=now)
+        .filter(Q(end_at__gte=now) | Q(end_at__isnull=True))
+        .order_by("-priority", "-start_at")
+    )
+
+
+def next_window_boundary(model):
+    """Earliest future start_at / end_at among active rows, or None."""
+    now = timezone.now()
+    bounds = model.objects.filter(is_active=True).aggregate(
+        next_start=Min("start_at", filter=Q(start_at__gt=now)),
+        next_end=Min("end_at", filter=Q(end_at__gte=now)),
+    )
+    upcoming = [value for value in bounds.values() if value is not None]
+    return min(upcoming) if upcoming else None
+
+
+def active_warnings_queryset(now=None):
+    return active_window_queryset(Warning, now)
+
+
+def active_warnings_snapshot():
+    return get_snapshot(
+        ACTIVE_WARNINGS,
+        lambda: WarningSerializer(active_warnings_queryset(), many=True).data,
+        lambda: next_window_boundary(Warning),
+    )
+
+
+def active_announcements_queryset(now=None):
+    return active_window_queryset(Announcement, now)
+
+
+def active_announcements_snapshot():
+    return get_snapshot(
+        ACTIVE_ANNOUNCEMENTS,
+        lambda: AnnouncementSerializer(active_announcements_queryset(), many=True).data,
+        lambda: next_window_boundary(Announcement),
+    )
+
+
+def upcoming_events_queryset(now=None):
+    now = now or timezone.now()
+    return (
+        Event.objects
+        .filter(is_active=True, start_date__gte=now)
+        .order_by("start_date")[:UPCOMING_EVENTS_LIMIT]
+    )
+
+
+def next_event_boundary():
+    # The list changes when its first event starts (it drops off and the
+    # sixth moves up); later starts are covered by the rebuild that follows
+    return (
+        Event.objects
+        .filter(is_active=True, start_date__gte=timezone.now())
+        .order_by("start_date")
+        .values_list("start_date", flat=True)
+        .first()
+    )
+
+
+def upcoming_events_snapshot():
+    return get_snapshot(
+        UPCOMING_EVENTS,
+        lambda: EventSerializer(upcoming_events_queryset(), many=True).data,
+        next_event_boundary,
+    )
+
+
+def latest_news_snapshot():
+    # First page of the news list (relative image URLs: no request here)
+    return get_snapshot(
+        LATEST_NEWS,
+        lambda: NewsListSerializer(
+            News.objects.filter(is_published=True).defer("content").order_by("-published_at", "-id")[:LATEST_NEWS_LIMIT],
+            many=True,
+        ).data,
+        lambda: None,
+    )
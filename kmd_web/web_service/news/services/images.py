@@ -0,0 +1,87 @@
+import hashlib
+import io
+import posixpath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, features
+
+# srcset widths; widths above the original's are skipped
+WIDTHS = (320, 640, 960, 1280)
+
+# format -> Pillow save options
+FORMATS = {
+    "avif": {"format": "AVIF", "quality": 55, "speed": 6},
+    "webp": {"format": "WEBP", "quality": 78, "method": 4},
+}
+
+
+def available_formats():
+    return [fmt for fmt in FORMATS if features.check(fmt)]
+
+
+def variant_name(source_name, source_size, width, fmt):
+    """
+    Deterministic path for a derivative, e.g.
+    news/2026/10/storm.jpg -> news/variants/2026/10/storm-1a2b3c4d-640w.webp.
+    The hash covers name + size, so re-uploading over the same name gets
+    new URLs (safe to cache forever) while re-running the task is a no-op.
+    """
+    directory, filename = posixpath.split(source_name)
+    stem = posixpath.splitext(filename)[0]
+    digest = hashlib.sha1(f"{source_name}:{source_size}".encode()).hexdigest()[:8]
+    directory = "news/variants/" + directory.removeprefix("news/")
+    return f"{directory.rstrip('/')}/{stem}-{digest}-{width}w.{fmt}"
+
+
+def _encode(image, width, fmt):
+    height = round(image.height * width / image.width)
+    resized = image.resize((width, height), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    resized.save(buffer, **FORMATS[fmt])
+    return buffer.getvalue()
+
+
+def generate_variants(news):
+    """
+    Build every missing derivative for `news.image` and return the new
+    `image_variants` map. Files that already exist are reused.
+    """
+    if not news.image:
+        return {}
+
+    source_name = news.image.name
+    source_size = news.image.size
+
+    with news.image.open("rb") as fh:
+        image = ImageOps.exif_transpose(Image.open(fh))
+        image.load()
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    widths = [width for width in WIDTHS if width < image.width] or [image.width]
+
+    variants = {"source": source_name, "width": image.width, "height": image.height}
+    for fmt in available_formats():
+        variants[fmt] = {}
+        for width in widths:
+            name = variant_name(source_name, source_size, width, fmt)
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(_encode(image, width, fmt)))
+            variants[fmt][str(width)] = name
+
+    return variants
+
+
+def delete_variants(variants, keep=None):
+    """Remove derivative files listed in `variants` but not in `keep`."""
+    keep_names = {
+        name
+        for fmt in FORMATS
+        for name in (keep or {}).get(fmt, {}).values()
+    }
+    for fmt in FORMATS:
+        for name in variants.get(fmt, {}).values():
+            if name not in keep_names and default_storage.exists(name):
+                default_storage.delete(name)
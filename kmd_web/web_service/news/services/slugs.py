@@ -0,0 +1,94 @@
+from django.db.models import Q
+from django.utils.text import slugify
+
+# Characters kept free at the end of a long slug for a "-<n>" suffix
+SUFFIX_ROOM = 8
+PREFIX_CHUNK = 200  # OR'd startswith terms per query in bulk mode
+
+
+class SlugAllocator:
+    """
+    Hands out unique slugs for one model without a query per collision.
+
+    Every slug that could collide with a title's base slug is fetched up
+    front with `slug__startswith` (one query for any number of titles),
+    then candidates are picked in memory. Slugs handed out are remembered,
+    so duplicates inside a bulk batch are resolved too.
+    """
+
+    def __init__(self, model, field="slug", exclude_pk=None):
+        self.model = model
+        self.field = field
+        self.exclude_pk = exclude_pk
+        self.max_length = model._meta.get_field(field).max_length
+        self.taken = set()
+        self.fetched = set()
+        self.counters = {}
+
+    def base(self, title):
+        base = slugify(title)[:self.max_length].strip("-")
+        return base or self.model._meta.model_name
+
+    def _prefix(self, base):
+        # Suffixed candidates of a long base are truncated, so match on the
+        # part every candidate shares
+        return base[:self.max_length - SUFFIX_ROOM] if len(base) > self.max_length - SUFFIX_ROOM else base
+
+    def prefetch(self, titles):
+        prefixes = sorted({self._prefix(self.base(title)) for title in titles} - self.fetched)
+
+        for start in range(0, len(prefixes), PREFIX_CHUNK):
+            chunk = prefixes[start:start + PREFIX_CHUNK]
+            query = Q()
+            for prefix in chunk:
+                query |= Q(**{f"{self.field}__startswith": prefix})
+
+            existing = self.model._default_manager.filter(query)
+            if self.exclude_pk is not None:
+                existing = existing.exclude(pk=self.exclude_pk)
+            self.taken.update(existing.values_list(self.field, flat=True))
+            self.fetched.update(chunk)
+
+    def allocate(self, title):
+        base = self.base(title)
+        self.prefetch([title])
+
+        slug = base
+        count = self.counters.get(base, 1)
+        while slug in self.taken:
+            suffix = f"-{count}"
+            slug = base[:self.max_length - len(suffix)].rstrip("-") + suffix
+            count += 1
+
+        self.counters[base] = count
+        self.taken.add(slug)
+        return slug
+
+
+def unique_slug(instance, title, field="slug"):
+    """Slug for one instance being saved (one query)."""
+    return SlugAllocator(type(instance), field, exclude_pk=instance.pk).allocate(title)
+
+
+def assign_slugs(instances, source="title", field="slug"):
+    """Fill in missing slugs on unsaved instances of one model."""
+    pending = [obj for obj in instances if not getattr(obj, field)]
+    if not pending:
+        return instances
+
+    allocator = SlugAllocator(type(pending[0]), field)
+    allocator.prefetch([getattr(obj, source) for obj in pending])
+    for obj in pending:
+        setattr(obj, field, allocator.allocate(getattr(obj, source)))
+    return instances
+
+
+def bulk_create_with_slugs(model, instances, batch_size=500, source="title", field="slug"):
+    """
+    bulk_create for models with an auto-generated slug, e.g. importing the
+    news back catalogue. Note bulk_create skips save() and signals.
+    """
+    return model.objects.bulk_create(
+        assign_slugs(list(instances), source, field),
+        batch_size=batch_size,
+    )
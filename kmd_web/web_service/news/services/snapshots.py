@@ -0,0 +1,86 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from forecasts.services.file_serving import not_modified, set_validators
+
+MAX_TIMEOUT = 60 * 60 * 24  # no boundary ahead: still rebuild daily
+
+
+def _version_key(name):
+    return f"news:snapshot:{name}:version"
+
+
+def _version(name):
+    version = cache.get(_version_key(name))
+    if version is None:
+        cache.add(_version_key(name), 1, None)
+        version = cache.get(_version_key(name), 1)
+    return version
+
+
+def invalidate_snapshot(name):
+    """
+    Bump the snapshot's version once the current transaction commits, so
+    a rebuild racing with the write can never be served afterwards.
+    """
+    def bump():
+        try:
+            cache.incr(_version_key(name))
+        except ValueError:
+            cache.set(_version_key(name), 1, None)
+
+    transaction.on_commit(bump)
+
+
+def get_snapshot(name, build, next_boundary):
+    """
+    Cached {"data", "etag", "last_modified", "valid_until"} for a
+    time-windowed list.
+
+    `build()` returns the JSON-ready data; `next_boundary()` returns
+    the next datetime at which the window's membership changes (an item
+    starts or ends), or None. The snapshot lives until that boundary or
+    until `invalidate_snapshot(name)` is called, whichever comes first.
+    """
+    key = f"news:snapshot:{name}:{_version(name)}"
+    now = time.time()
+
+    snapshot = cache.get(key)
+    if snapshot is not None and (snapshot["valid_until"] is None or now < snapshot["valid_until"]):
+        return snapshot
+
+    data = build()
+    boundary = next_boundary()
+    valid_until = boundary.timestamp() if boundary else None
+
+    payload = json.dumps(data, cls=JSONEncoder, sort_keys=True)
+    snapshot = {
+        "data": data,
+        "etag": '"%s"' % hashlib.md5(payload.encode()).hexdigest(),
+        "last_modified": int(now),
+        "valid_until": valid_until,
+    }
+
+    timeout = MAX_TIMEOUT if valid_until is None else min(MAX_TIMEOUT, max(1, int(valid_until - now) + 1))
+    cache.set(key, snapshot, timeout)
+    return snapshot
+
+
+def snapshot_response(request, snapshot):
+    """DRF Response for a snapshot, or a 304 when the client's ETag matches."""
+    etag, last_modified = snapshot["etag"], snapshot["last_modified"]
+
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        response = set_validators(Response(snapshot["data"]), etag, last_modified)
+
+    # Always revalidate: an item may have expired since the last poll
+    patch_cache_control(response, no_cache=True)
+    return response
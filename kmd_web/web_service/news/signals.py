@@ -0,0 +1,69 @@
+#news/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from notifications.services.channel import publish_on_commit
+
+from .alerts_models import Warning
+from .event_models import Event
+from .models import Announcement, News
+from .serializers import AnnouncementSerializer, WarningSerializer
+from .services.feeds import ACTIVE_ANNOUNCEMENTS, ACTIVE_WARNINGS, LATEST_NEWS, UPCOMING_EVENTS
+from .services.snapshots import invalidate_snapshot
+from .tasks import generate_news_image_variants
+
+
+@receiver(post_save, sender=Warning)
+@receiver(post_delete, sender=Warning)
+def refresh_active_warnings(sender, instance, **kwargs):
+    invalidate_snapshot(ACTIVE_WARNINGS)
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def refresh_active_announcements(sender, instance, **kwargs):
+    invalidate_snapshot(ACTIVE_ANNOUNCEMENTS)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def refresh_upcoming_events(sender, instance, **kwargs):
+    invalidate_snapshot(UPCOMING_EVENTS)
+
+
+@receiver(post_save, sender=News)
+@receiver(post_delete, sender=News)
+def refresh_latest_news(sender, instance, **kwargs):
+    invalidate_snapshot(LATEST_NEWS)
+
+
+@receiver(post_save, sender=Warning)
+def push_warning_saved(sender, instance, **kwargs):
+    publish_on_commit("warnings", "saved", WarningSerializer(instance).data)
+
+
+@receiver(post_delete, sender=Warning)
+def push_warning_deleted(sender, instance, **kwargs):
+    publish_on_commit("warnings", "deleted", {"id": instance.pk, "slug": instance.slug})
+
+
+@receiver(post_save, sender=Announcement)
+def push_announcement_saved(sender, instance, **kwargs):
+    publish_on_commit("announcements", "saved", AnnouncementSerializer(instance).data)
+
+
+@receiver(post_delete, sender=Announcement)
+def push_announcement_deleted(sender, instance, **kwargs):
+    publish_on_commit("announcements", "deleted", {"id": instance.pk, "slug": instance.slug})
+
+
+@receiver(post_save, sender=News)
+def queue_news_image_variants(sender, instance, **kwargs):
+    """Resize on upload, not on the first list request."""
+    source = instance.image.name if instance.image else None
+    if source == (instance.image_variants or {}).get("source"):
+        return
+
+    news_id = instance.pk
+    transaction.on_commit(lambda: generate_news_image_variants.delay(news_id))
@@ -0,0 +1,30 @@
+#news/tasks.py
+from celery import shared_task
+from .models import News
+from .services.feeds import LATEST_NEWS
+from .services.images import delete_variants, generate_variants
+from .services.snapshots import invalidate_snapshot
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
+def generate_news_image_variants(self, news_id):
+    news = News.objects.filter(pk=news_id).first()
+    if news is None:
+        return f"News {news_id} no longer exists"
+
+    old_variants = news.image_variants or {}
+    variants = generate_variants(news)
+
+    # update(), not save(): no post_save, so no re-queue loop. Only while
+    # the row still has the image these were built from
+    updated = News.objects.filter(pk=news_id, image=news.image.name).update(image_variants=variants)
+    if not updated:
+        # Image replaced (or row deleted) meanwhile; its own task owns the row
+        current = News.objects.filter(pk=news_id).values_list("image_variants", flat=True).first()
+        delete_variants(variants, keep=current)
+        return f"Discarded stale image variants for news {news_id}"
+
+    invalidate_snapshot(LATEST_NEWS)
+    delete_variants(old_variants, keep=variants)
+
+    return f"Generated image variants for {news}"
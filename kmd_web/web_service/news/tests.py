@@ -1,3 +1,47 @@
 from django.test import TestCase
 
-# Create your tests here.
+from .models import Announcement
+from .services.slugs import SlugAllocator, assign_slugs, unique_slug
+
+
+class SlugAllocatorTests(TestCase):
+    def announce(self, title, **fields):
+        return Announcement.objects.create(title=title, message="-", **fields)
+
+    def test_collisions_get_numbered_suffixes(self):
+        slugs = [self.announce("Storm Alert").slug for _ in range(3)]
+
+        self.assertEqual(slugs, ["storm-alert", "storm-alert-1", "storm-alert-2"])
+
+    def test_one_query_however_many_collisions(self):
+        for suffix in ("", "-1", "-2", "-3"):
+            self.announce("x", slug=f"storm-alert{suffix}")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(unique_slug(Announcement(), "Storm alert!"), "storm-alert-4")
+
+    def test_long_titles_keep_suffixes_within_max_length(self):
+        title = "Heavy rainfall " * 30
+        first, second = self.announce(title).slug, self.announce(title).slug
+
+        self.assertLessEqual(len(first), 255)
+        self.assertTrue(second.endswith("-1"))
+        self.assertLessEqual(len(second), 255)
+        self.assertNotEqual(first, second)
+
+    def test_own_slug_is_not_a_collision(self):
+        announcement = self.announce("Storm Alert")
+
+        self.assertEqual(unique_slug(announcement, "Storm Alert"), "storm-alert")
+
+    def test_unsluggable_title_falls_back_to_model_name(self):
+        self.assertEqual(SlugAllocator(Announcement).base("!!!"), "announcement")
+
+    def test_bulk_titles_are_resolved_in_one_query(self):
+        self.announce("Flood Watch")
+        pending = [Announcement(title=title, message="-") for title in ("Flood Watch", "Flood watch", "Dry spell")]
+
+        with self.assertNumQueries(1):
+            assign_slugs(pending)
+
+        self.assertEqual([a.slug for a in pending], ["flood-watch-1", "flood-watch-2", "dry-spell"])
@@ -1,10 +1,15 @@
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import AllowAny
-from django.utils import timezone
-from django.db.models import Q
-from .event_models import Event
 from .models import News, Announcement
-from .serializers import NewsSerializer, AnnouncementSerializer, EventSerializer
+from .pagination import NewsCursorPagination
+from .serializers import NewsListSerializer, NewsSerializer, AnnouncementSerializer, EventSerializer
+from .services.feeds import (
+    active_announcements_queryset,
+    active_announcements_snapshot,
+    upcoming_events_queryset,
+    upcoming_events_snapshot,
+)
+from .services.snapshots import snapshot_response
 
 
 # -------------------
@@ -12,14 +17,16 @@ from .serializers import NewsSerializer, AnnouncementSerializer, EventSerializer
 # -------------------
 
 class NewsListView(ListAPIView):
-    serializer_class = NewsSerializer
+    serializer_class = NewsListSerializer
     permission_classes = [AllowAny]
+    pagination_class = NewsCursorPagination
 
     def get_queryset(self):
+        # Ordering comes from the paginator; content is only needed on detail
         return (
             News.objects
             .filter(is_published=True)
-            .order_by("-published_at")
+            .defer("content")
         )
 
 
@@ -41,14 +48,11 @@ class ActiveAnnouncementListView(ListAPIView):
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        now = timezone.now()
+        return active_announcements_queryset()
 
-        return (
-            Announcement.objects
-            .filter(is_active=True, start_at__lte=now)
-            .filter(Q(end_at__gte=now) | Q(end_at__isnull=True))
-            .order_by("-priority", "-start_at")
-        )
+    # Cached until an announcement is saved/deleted or the next one starts/ends
+    def list(self, request, *args, **kwargs):
+        return snapshot_response(request, active_announcements_snapshot())
 
 class ActiveAnnouncementDetailView(RetrieveAPIView):
     serializer_class = AnnouncementSerializer
@@ -66,11 +70,8 @@ class UpcomingEventsView(ListAPIView):
     permission_classes = [AllowAny]
 
     def get_queryset(self):
+        return upcoming_events_queryset()
 
-        now = timezone.now()
-
-        return (
-            Event.objects
-            .filter(is_active=True, start_date__gte=now)
-            .order_by("start_date")[:5]
-        )
\ No newline at end of file
+    # Cached until an event is saved/deleted or the first listed one starts
+    def list(self, request, *args, **kwargs):
+        return snapshot_response(request, upcoming_events_snapshot())
\ No newline at end of file
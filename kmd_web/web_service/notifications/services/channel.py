@@ -0,0 +1,155 @@
+"""
+Push channel: producers (signals, Celery tasks) XADD events to one Redis
+stream; each ASGI worker process runs a single XREAD loop and fans events
+out to its connected SSE clients through in-memory queues.
+
+A stream (rather than pub/sub) keeps the last few thousand events, so a
+client reconnecting with Last-Event-ID gets what it missed.
+"""
+import asyncio
+import json
+import logging
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+STREAM = "rsmc:push"
+MAXLEN = 5000
+BLOCK_MS = 15000
+QUEUE_SIZE = 100
+
+TOPICS = ("warnings", "announcements", "forecasts", "wrf")
+
+_client = None
+
+
+def _redis_url():
+    return getattr(settings, "PUSH_REDIS_URL", settings.REDIS_URL)
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(_redis_url())
+    return _client
+
+
+def publish(topic, event, data):
+    """Append an event to the stream. Never raises: a push is best effort."""
+    try:
+        _get_client().xadd(
+            STREAM,
+            {
+                "topic": topic,
+                "event": event,
+                "data": json.dumps(data, cls=DjangoJSONEncoder),
+            },
+            maxlen=MAXLEN,
+            approximate=True,
+        )
+    except redis.RedisError:
+        logger.warning("push: could not publish %s.%s", topic, event, exc_info=True)
+
+
+def publish_on_commit(topic, event, data):
+    """Publish once the surrounding transaction commits (immediately if none)."""
+    transaction.on_commit(lambda: publish(topic, event, data))
+
+
+def _decode(entry_id, fields):
+    fields = {key.decode(): value.decode() for key, value in fields.items()}
+    return {
+        "id": entry_id.decode() if isinstance(entry_id, bytes) else entry_id,
+        "topic": fields["topic"],
+        "event": fields["event"],
+        "data": fields["data"],
+    }
+
+
+def stream_id_key(entry_id):
+    """"1712345678901-3" -> (1712345678901, 3), for ordering stream ids."""
+    ms, _, seq = entry_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+class Broadcaster:
+    """One XREAD loop per process, shared by every connected client."""
+
+    def __init__(self):
+        self.queues = set()
+        self.task = None
+        self.client = None
+        self.loop = None
+
+    def subscribe(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            # New event loop (e.g. runserver runs each async view in its own)
+            self.queues, self.task, self.client, self.loop = set(), None, None, loop
+
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.queues.add(queue)
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.queues.discard(queue)
+
+    def _get_client(self):
+        if self.client is None:
+            # Socket timeout must outlast XREAD's BLOCK
+            self.client = aioredis.Redis.from_url(
+                _redis_url(), socket_timeout=BLOCK_MS / 1000 + 5
+            )
+        return self.client
+
+    async def replay(self, last_id):
+        """Events after `last_id` still held in the stream."""
+        try:
+            entries = await self._get_client().xrange(STREAM, min=f"({last_id}", count=MAXLEN)
+        except redis.RedisError:
+            logger.warning("push: replay from %s failed", last_id, exc_info=True)
+            return []
+        return [_decode(entry_id, fields) for entry_id, fields in entries]
+
+    async def run(self):
+        client = self._get_client()
+        last_id = None
+
+        while self.queues:
+            try:
+                if last_id is None:
+                    latest = await client.xrevrange(STREAM, count=1)
+                    last_id = latest[0][0] if latest else "0-0"
+
+                response = await client.xread({STREAM: last_id}, block=BLOCK_MS, count=100)
+            except redis.TimeoutError:
+                continue
+            except redis.RedisError:
+                logger.warning("push: stream read failed, retrying", exc_info=True)
+                await asyncio.sleep(1)
+                continue
+
+            for _, entries in response or []:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    event = _decode(entry_id, fields)
+                    for queue in list(self.queues):
+                        try:
+                            queue.put_nowait(event)
+                        except asyncio.QueueFull:
+                            # Slow client: drop it, the browser reconnects
+                            # with Last-Event-ID and replays from the stream
+                            self.queues.discard(queue)
+                            while not queue.empty():
+                                queue.get_nowait()
+                            queue.put_nowait(None)
+
+
+broadcaster = Broadcaster()
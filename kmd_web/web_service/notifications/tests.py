@@ -0,0 +1,99 @@
+import asyncio
+import json
+from unittest import mock
+
+import redis
+from django.test import SimpleTestCase
+
+from .services import channel
+from .services.channel import STREAM, Broadcaster, publish, stream_id_key
+
+
+def entry(entry_id, topic, event, data):
+    return entry_id.encode(), {
+        b"topic": topic.encode(),
+        b"event": event.encode(),
+        b"data": json.dumps(data).encode(),
+    }
+
+
+class FakeStream:
+    """Async stand-in for the XREAD client: hands out `entries` once."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    async def xrevrange(self, stream, count):
+        return []
+
+    async def xread(self, streams, block, count):
+        if self.entries:
+            batch, self.entries = self.entries, []
+            return [(STREAM.encode(), batch)]
+        await asyncio.sleep(0.01)
+        return []
+
+
+class PublishTests(SimpleTestCase):
+    @mock.patch.object(channel, "_get_client")
+    def test_appends_json_event_to_capped_stream(self, get_client):
+        publish("warnings", "issued", {"id": 7})
+
+        get_client.return_value.xadd.assert_called_once_with(
+            STREAM,
+            {"topic": "warnings", "event": "issued", "data": '{"id": 7}'},
+            maxlen=channel.MAXLEN,
+            approximate=True,
+        )
+
+    @mock.patch.object(channel, "_get_client")
+    def test_redis_errors_are_swallowed(self, get_client):
+        get_client.return_value.xadd.side_effect = redis.ConnectionError("down")
+
+        with self.assertLogs(channel.logger, "WARNING"):
+            publish("wrf", "maps_ready", {})
+
+    def test_stream_ids_order_numerically(self):
+        self.assertLess(stream_id_key("999-9"), stream_id_key("1000-0"))
+        self.assertLess(stream_id_key("1000-2"), stream_id_key("1000-10"))
+
+
+class BroadcasterTests(SimpleTestCase):
+    def listen(self, entries):
+        """Two subscribers on a Broadcaster reading `entries`."""
+        broadcaster = Broadcaster()
+        queues = [broadcaster.subscribe() for _ in range(2)]
+        broadcaster.client = FakeStream(entries)  # before the loop's first await
+        return broadcaster, queues
+
+    async def stop(self, broadcaster):
+        broadcaster.queues.clear()
+        await asyncio.wait_for(broadcaster.task, 1)
+
+    async def test_one_read_loop_fans_out_to_every_subscriber(self):
+        broadcaster, queues = self.listen([entry("1-0", "warnings", "issued", {"id": 1})])
+        try:
+            for queue in queues:
+                event = await asyncio.wait_for(queue.get(), 1)
+                self.assertEqual(event, {"id": "1-0", "topic": "warnings", "event": "issued", "data": '{"id": 1}'})
+        finally:
+            await self.stop(broadcaster)
+
+    async def test_full_queue_is_dropped_with_a_sentinel(self):
+        entries = [entry(f"{n}-0", "forecasts", "published", {"n": n}) for n in (1, 2)]
+        with mock.patch.object(channel, "QUEUE_SIZE", 1):
+            broadcaster, (slow, _) = self.listen(entries)
+        try:
+            self.assertIsNone(await asyncio.wait_for(slow.get(), 1))
+            self.assertNotIn(slow, broadcaster.queues)
+        finally:
+            await self.stop(broadcaster)
+
+    async def test_unsubscribing_everyone_ends_the_read_loop(self):
+        broadcaster, queues = self.listen([])
+
+        for queue in queues:
+            broadcaster.unsubscribe(queue)
+        await asyncio.wait_for(broadcaster.task, 1)
+
+        self.assertTrue(broadcaster.task.done())
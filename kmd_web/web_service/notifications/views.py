@@ -0,0 +1,79 @@
+import asyncio
+
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from .services.channel import TOPICS, broadcaster, stream_id_key
+
+KEEPALIVE_SECONDS = 20
+RETRY_MS = 5000
+
+
+def _sse(event):
+    lines = [f"id: {event['id']}", f"event: {event['topic']}.{event['event']}"]
+    lines += [f"data: {line}" for line in event["data"].splitlines() or [""]]
+    return "\n".join(lines) + "\n\n"
+
+
+@require_GET
+async def event_stream(request):
+    """
+    GET /api/notifications/stream/?topics=warnings,wrf
+
+    Server-Sent Events. Event names are "<topic>.<event>", e.g.
+    "warnings.saved", "forecasts.published", "wrf.maps_ready"; `data` is
+    JSON. Browsers resume via Last-Event-ID after a reconnect.
+
+    Async view: must be served by the ASGI app (uvicorn), not gunicorn's
+    WSGI workers, which would be held for the lifetime of each client.
+    """
+    topics = {
+        topic.strip() for topic in request.GET.get("topics", "").split(",")
+        if topic.strip()
+    }
+    invalid = topics - set(TOPICS)
+    if invalid:
+        return JsonResponse({
+            "error": f"Invalid topics. Available: {', '.join(TOPICS)}"
+        }, status=400)
+
+    last_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    if last_id:
+        try:
+            stream_id_key(last_id)
+        except ValueError:
+            last_id = None
+
+    async def events():
+        queue = broadcaster.subscribe()
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+
+            seen = stream_id_key(last_id) if last_id else None
+            if last_id:
+                for event in await broadcaster.replay(last_id):
+                    seen = stream_id_key(event["id"])
+                    if not topics or event["topic"] in topics:
+                        yield _sse(event)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    break  # dropped as a slow consumer; client will reconnect
+                if seen and stream_id_key(event["id"]) <= seen:
+                    continue  # already sent during replay
+                if topics and event["topic"] not in topics:
+                    continue
+                yield _sse(event)
+        finally:
+            broadcaster.unsubscribe(queue)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx: flush each event
+    return response
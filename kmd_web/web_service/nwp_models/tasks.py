@@ -3,6 +3,7 @@ from celery import shared_task
 from .rainfall_mapper import RainfallMapper
 from .temparature_mapper import TemperatureMapper
 from .wind_mapper import WindMapper
+from notifications.services.channel import publish
 import os
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
@@ -30,4 +31,10 @@ def process_new_wrf(self, nc_path):
     wind.load_data()
     wind.generate_map()
 
+    # 📣 Tell connected clients the run's maps are ready
+    publish("wrf", "maps_ready", {
+        "run_id": run_id,
+        "variables": ["rainfall", "temperature", "wind"],
+    })
+
     return f"Maps generated for {run_id}"
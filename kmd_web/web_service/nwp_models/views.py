@@ -4,8 +4,9 @@ from rest_framework.response import Response
 from .tasks import process_new_wrf
 import os
 import json
-from django.http import FileResponse, HttpResponseBadRequest
+from django.http import HttpResponseBadRequest
 from django.conf import settings
+from forecasts.services.file_serving import serve_file
 
 
 BASE_MAP_DIR = "/home/haron/kmd/generated_maps"
@@ -108,7 +109,8 @@ def get_wrf_field(request):
         [33.0, 5.0],
     ]
 
-    response = FileResponse(open(file_path, "rb"), content_type="image/png")
+    # 304 when the client's ETag / Last-Modified still matches the map on disk
+    response = serve_file(request, file_path, content_type="image/png")
 
     # 🔥 Important headers
     response["X-Domain-Bounds"] = json.dumps(bounds)
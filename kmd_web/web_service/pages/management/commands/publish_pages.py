@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from home.home.models import Home
+from home.home.services.content import HOME_LIST_PATH, home_path, render_home, render_home_list
+from pages.models import Page
+from pages.services.published import page_path, publish, publish_root, render_page
+
+
+class Command(BaseCommand):
+    help = "Render every Page and published Home entry to PUBLISHED_JSON_ROOT (run after deploy)"
+
+    def handle(self, *args, **options):
+        pages = 0
+        for slug in Page.objects.values_list("slug", flat=True):
+            publish(page_path(slug), render_page(slug))
+            pages += 1
+
+        homes = 0
+        for slug in Home.objects.filter(is_published=True).values_list("slug", flat=True):
+            publish(home_path(slug), render_home(slug))
+            homes += 1
+        publish(HOME_LIST_PATH, render_home_list())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Published {pages} page(s) and {homes} home entr{'y' if homes == 1 else 'ies'} to {publish_root()}."
+        ))
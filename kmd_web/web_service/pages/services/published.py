@@ -0,0 +1,132 @@
+"""
+CMS content (Page, Home) rendered to JSON once, on save.
+
+Each entry is written to PUBLISHED_JSON_ROOT/<path>.json, where nginx
+serves it directly (see gunicorn_nginx_start.sh), and kept in the cache
+for the Django fallback views. Files are written only by signals and
+the `publish_pages` command; a read never writes and, once cached,
+never touches the database or a serializer.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from forecasts.services.file_serving import not_modified, set_validators
+from pages.models import Page
+from pages.serializers import PageSerializer
+
+MISSING = "missing"  # cached marker: no such published entry
+
+
+def publish_root():
+    return Path(settings.PUBLISHED_JSON_ROOT)
+
+
+def max_age():
+    return getattr(settings, "PUBLISHED_JSON_MAX_AGE", 300)
+
+
+def _cache_key(path):
+    return f"published:{path}"
+
+
+def _file(path):
+    # Paths are built from slugs; refuse anything that could leave the root
+    if not re.fullmatch(r"[-\w]+(/[-\w]+)*", path):
+        raise ValueError(f"Invalid publish path: {path!r}")
+    return publish_root() / f"{path}.json"
+
+
+def _write_atomic(target, payload):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, target)  # nginx never sees a half-written file
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _render(data):
+    payload = json.dumps(data, cls=JSONEncoder, ensure_ascii=False).encode()
+    entry = {
+        "data": json.loads(payload),
+        "etag": '"%s"' % hashlib.md5(payload).hexdigest(),
+        "last_modified": int(time.time()),
+    }
+    return payload, entry
+
+
+def publish(path, data):
+    """Render `data` to <root>/<path>.json and the cache; returns the entry."""
+    payload, entry = _render(data)
+    _write_atomic(_file(path), payload)
+    cache.set(_cache_key(path), entry, None)
+    return entry
+
+
+def unpublish(path):
+    try:
+        _file(path).unlink()
+    except FileNotFoundError:
+        pass
+    cache.set(_cache_key(path), MISSING, None)
+
+
+def get_published(path, build):
+    """
+    Cached entry for `path`, or None when it does not exist. On a cold
+    cache `build()` renders the data (or returns None for a 404) into
+    the cache only; the file is left to signals / `publish_pages`.
+    """
+    entry = cache.get(_cache_key(path))
+    if entry == MISSING:
+        return None
+    if entry is not None:
+        return entry
+
+    data = build()
+    if data is None:
+        cache.set(_cache_key(path), MISSING, max_age())
+        return None
+
+    _, entry = _render(data)
+    cache.set(_cache_key(path), entry, max_age())
+    return entry
+
+
+def published_response(request, entry):
+    etag, last_modified = entry["etag"], entry["last_modified"]
+
+    response = not_modified(request, etag, last_modified)
+    if response is None:
+        response = set_validators(Response(entry["data"]), etag, last_modified)
+
+    patch_cache_control(response, public=True, max_age=max_age())
+    return response
+
+
+# -------------------
+# Pages
+# -------------------
+
+def page_path(slug):
+    return f"pages/{slug}"
+
+
+def render_page(slug):
+    page = Page.objects.filter(slug=slug).first()
+    return PageSerializer(page).data if page else None
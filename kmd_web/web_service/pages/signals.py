@@ -0,0 +1,38 @@
+#pages/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Page
+from .services.published import page_path, publish, render_page, unpublish
+
+
+@receiver(pre_save, sender=Page)
+def remember_page_slug(sender, instance, **kwargs):
+    instance._published_slug = (
+        Page.objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Page)
+def publish_page(sender, instance, **kwargs):
+    """Render the page once per edit instead of once per request."""
+    old_slug, slug = getattr(instance, "_published_slug", None), instance.slug
+
+    def refresh():
+        if old_slug and old_slug != slug:
+            unpublish(page_path(old_slug))
+        data = render_page(slug)
+        if data is None:
+            unpublish(page_path(slug))
+        else:
+            publish(page_path(slug), data)
+
+    transaction.on_commit(refresh)
+
+
+@receiver(post_delete, sender=Page)
+def unpublish_page(sender, instance, **kwargs):
+    slug = instance.slug
+    transaction.on_commit(lambda: unpublish(page_path(slug)))
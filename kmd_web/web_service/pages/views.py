@@ -1,13 +1,24 @@
 from django.shortcuts import render
 
 # Create your views here.
+from django.http import Http404
 from rest_framework.generics import RetrieveAPIView
 from .models import Page
 from .serializers import PageSerializer
+from .services.published import get_published, page_path, published_response, render_page
 
 class PageDetailView(RetrieveAPIView):
     queryset = Page.objects.all()
     serializer_class = PageSerializer
     lookup_field = "slug"
 
+    # Normally answered by nginx from the published file; this is the
+    # fallback, served from the cache after the first render
+    def retrieve(self, request, *args, **kwargs):
+        slug = kwargs[self.lookup_field]
+        entry = get_published(page_path(slug), lambda: render_page(slug))
+        if entry is None:
+            raise Http404
+        return published_response(request, entry)
+
 
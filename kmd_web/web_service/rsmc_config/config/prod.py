@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
 
     "rest_framework",
@@ -62,6 +63,7 @@ INSTALLED_APPS = [
     "wrfapi",
     "news",
     "user_accounts",
+    "notifications",
 ]
 
 MIDDLEWARE = [
@@ -177,6 +179,22 @@ GENERATED_MAPS_DIR = BASE_DIR / "generated_maps"
 for directory in [WRF_DATA_DIR, GENERATED_MAPS_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 MEDIA_ROOT = "/home/haron/uploads/"
+
+# File downloads
+# "django"  -> stream through the gunicorn worker (runserver / no nginx)
+# "x-accel" -> Django validates, nginx sends the file via X-Accel-Redirect
+FILE_DOWNLOAD_MODE = os.getenv("FILE_DOWNLOAD_MODE", "django")
+
+# Disk root -> nginx `internal` location (see gunicorn_nginx_start.sh)
+X_ACCEL_LOCATIONS = {
+    MEDIA_ROOT: "/protected/uploads/",
+    "/home/haron/kmd/generated_maps/": "/protected/maps/",
+}
+
+# CMS pages (Page, Home) rendered to JSON on save; nginx serves these
+# files for /api/pages/<slug>/ and /api/home/ (see gunicorn_nginx_start.sh)
+PUBLISHED_JSON_ROOT = os.getenv("PUBLISHED_JSON_ROOT", "/var/www/rsmc/published")
+PUBLISHED_JSON_MAX_AGE = 300
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -200,7 +218,15 @@ CACHES = {
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
         }
-    }
+    },
+    # Own db so clearing the data cache never logs anyone out
+    "sessions": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://localhost:6379/4",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+        }
+    },
 }
 
 #CELERY_BROKER_URL = "redis://redis:6379/0"
@@ -215,6 +241,13 @@ CELERY_TASK_SERIALIZER = "json"
 # Celery Enhancements
 CELERY_RESULT_BACKEND = "redis://localhost:6379/0"
 REDIS_URL="redis://localhost:6379/0"
+# Server-Sent Events bus (notifications app); a Redis stream, not the broker queues
+PUSH_REDIS_URL = os.getenv("PUSH_REDIS_URL", "redis://localhost:6379/2")
+# Sliding-window limits on login/register/resend/forgot-password
+# (user_accounts.services.rate_limit); gunicorn sits behind nginx on a
+# unix socket, so the client address comes from proxy_params' X-Real-IP
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", "redis://localhost:6379/3")
+RATE_LIMIT_IP_HEADER = "HTTP_X_REAL_IP"
 
 CELERY_TIMEZONE = "UTC"
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
@@ -223,8 +256,77 @@ CELERY_TASK_ACKS_LATE = True
 CELERY_TASK_TIME_LIMIT = 1800
 CELERY_TASK_SOFT_TIME_LIMIT = 1500
 CELERY_WORKER_MAX_TASKS_PER_CHILD = 10
+
+# Queues (run.sh starts one worker per queue):
+#   render  - WRF map rendering, CPU-heavy, long; scales to all cores
+#   io      - SMTP and other network-bound jobs
+#   default - everything else (parsing, sync, thumbnails, beat jobs)
+# so an email or a thumbnail never waits behind a WRF cycle
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "nwp_models.tasks.process_new_wrf": {"queue": "render"},
+    "user_accounts.tasks.send_email_deliveries": {"queue": "io", "priority": 0},
+    "user_accounts.tasks.send_queued_emails": {"queue": "io", "priority": 6},
+}
+
+# Redis emulates priorities with one list per step; 0 is the highest
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "queue_order_strategy": "priority",
+    "priority_steps": list(range(10)),
+}
+CELERY_TASK_DEFAULT_PRIORITY = 3
+
+# CELERY_TASK_TIME_LIMIT above is sized for WRF renders; light jobs
+# that hang should fail fast instead of holding a worker for 30 min
+CELERY_TASK_ANNOTATIONS = {
+    task: {"time_limit": 300, "soft_time_limit": 240}
+    for task in (
+        "user_accounts.tasks.send_email_deliveries",
+        "user_accounts.tasks.send_queued_emails",
+        "news.tasks.generate_news_image_variants",
+    )
+}
+
+# Periodic jobs (run.sh starts the worker with an embedded beat)
+CELERY_BEAT_SCHEDULE = {
+    # Today's maps / guidance documents under MEDIA_ROOT/rsmc/<year>/<month>/<mon-dd>/
+    # -> Forecast rows read by forecasts/latest/all/ and the bootstrap
+    "sync-todays-forecasts": {
+        "task": "forecasts.tasks.sync_todays_forecasts",
+        "schedule": 60 * 5,
+    },
+    # Quarterly PDFs / event tables dropped under MEDIA_ROOT/rsmc/<year>/quarter_<n>/
+    "register-quarterly-artifacts": {
+        "task": "swfp_evaluation.tasks.register_quarterly_artifacts_task",
+        "schedule": 60 * 15,
+    },
+    # Account emails whose send task was lost or ran out of retries
+    "send-queued-emails": {
+        "task": "user_accounts.tasks.send_queued_emails",
+        "schedule": 60 * 5,
+    },
+    # Used/expired EmailVerification rows past EMAIL_VERIFICATION_RETENTION_DAYS
+    "purge-email-verifications": {
+        "task": "user_accounts.tasks.purge_email_verifications",
+        "schedule": 60 * 60,
+    },
+    "clear-expired-sessions": {
+        "task": "user_accounts.tasks.clear_expired_sessions",
+        "schedule": 60 * 60 * 24,
+    },
+}
 #SESSION_COOKIE_HTTPONLY = True
 
+# login_view authenticates through this (one lookup, timing-safe, hash upgrade)
+AUTHENTICATION_BACKENDS = ["user_accounts.backends.LoginBackend"]
+
+# Sessions live in Redis: with SESSION_SAVE_EVERY_REQUEST each request
+# would otherwise write the django_session table. Set SESSION_ENGINE to
+# "django.contrib.sessions.backends.cached_db" for sessions that survive
+# a Redis flush (reads still come from the cache; beat runs clearsessions)
+SESSION_ENGINE = os.getenv("SESSION_ENGINE", "django.contrib.sessions.backends.cache")
+SESSION_CACHE_ALIAS = "sessions"
+
 CSRF_COOKIE_HTTPONLY = False   # must be False for React
 SESSION_COOKIE_AGE = 600        # 10 minutes
 SESSION_SAVE_EVERY_REQUEST = True
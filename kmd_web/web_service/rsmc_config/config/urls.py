@@ -28,6 +28,7 @@ urlpatterns = [
     path("api/swfp_evaluation/", include("swfp_evaluation.urls")),
     path("api/", include("news.urls")),
     path("api/", include("user_accounts.urls")),
+    path("api/notifications/", include("notifications.urls")),
 ]
 
 
@@ -1,13 +1,28 @@
 #!/bin/bash
+# Usage: run.sh [default|io|render]
+# One worker per queue (see CELERY_TASK_ROUTES); beat runs with the
+# default worker. Without an argument a single worker serves all queues.
 
 BASE_DIR=$(dirname "$(realpath "$0")")
+QUEUE="${1:-all}"
 
 source "$BASE_DIR/venv/bin/activate"
 
 cd "$BASE_DIR"
 
+BEAT=(--beat --schedule="$BASE_DIR/run/celerybeat-schedule")
+
+case "$QUEUE" in
+    render)  OPTIONS=(-Q render --concurrency="${RENDER_CONCURRENCY:-$(nproc)}" --prefetch-multiplier=1) ;;
+    io)      OPTIONS=(-Q io --concurrency="${IO_CONCURRENCY:-4}") ;;
+    default) OPTIONS=(-Q default --concurrency="${DEFAULT_CONCURRENCY:-2}" "${BEAT[@]}") ;;
+    all)     OPTIONS=(-Q default,io,render --concurrency=2 "${BEAT[@]}") ;;
+    *)       echo "Unknown queue: $QUEUE" >&2; exit 1 ;;
+esac
+
 exec "$BASE_DIR/venv/bin/celery" \
      -A rsmc_config.config.celery worker \
      --loglevel=INFO \
-     --concurrency=2 \
-     --pidfile="$BASE_DIR/run/celery.pid"
+     -n "$QUEUE@%h" \
+     "${OPTIONS[@]}" \
+     --pidfile="$BASE_DIR/run/celery-$QUEUE.pid"
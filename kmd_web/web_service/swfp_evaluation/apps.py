@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SwfpEvaluationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'swfp_evaluation'
+
+    def ready(self):
+        from . import signals  # noqa: F401
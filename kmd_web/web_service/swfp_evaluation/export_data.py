@@ -0,0 +1,153 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from .get_verification_stats import parse_verification_params
+from .models import EventRow, EventTable
+from .services.event_tables import (
+    ROW_FILTERS,
+    EventTableNotParsed,
+    filter_event_rows,
+    processing_response,
+    quarter_label,
+    require_parse,
+)
+from .services.export import CONTENT_TYPES, export_response
+from .services.quarterly import event_tables_in_range
+from .services.verification import COUNT_FIELDS, verification_stats
+
+SCORE_FIELDS = ("pod", "far", "csi", "bias")
+
+# Not `format`: DRF reserves it for renderer selection
+FILETYPE_PARAM = "filetype"
+
+
+def _split(value):
+    return [part.strip() for part in value.split(",") if part.strip()] if value else []
+
+
+def _filetype(request):
+    filetype = request.GET.get(FILETYPE_PARAM, "csv").lower()
+    if filetype not in CONTENT_TYPES:
+        raise ValueError(f"Invalid {FILETYPE_PARAM}. Available: {', '.join(CONTENT_TYPES)}")
+    return filetype
+
+
+def _range_label(params):
+    if params.get("year") and params.get("quarter"):
+        return f"{params['year']}-Q{params['quarter']}"
+    return f"{params.get('from') or 'start'}_{params.get('to') or 'latest'}"
+
+
+@api_view(["GET"])
+def export_event_rows(request):
+    """
+    GET /api/swfp_evaluation/events-table-data/export/?filetype=xlsx&from=2023-Q1&to=2025-Q4&hazard=heavy rain
+
+    Same filters / sort / columns as events-table-data, over one quarter
+    (year & quarter) or a range (from / to). Rows are streamed quarter by
+    quarter straight from the EventRow table.
+    """
+    try:
+        filetype = _filetype(request)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    if request.GET.get("year") and request.GET.get("quarter"):
+        try:
+            events = EventTable.objects.filter(
+                year=int(request.GET["year"]),
+                quarter=int(request.GET["quarter"]),
+                is_active=True,
+            )
+        except ValueError:
+            return Response({"error": "Invalid parameters"}, status=400)
+    else:
+        try:
+            events = event_tables_in_range(request.GET.get("from"), request.GET.get("to"))
+        except ValueError as e:
+            return Response({"error": f"Invalid quarter {e}, use YYYY-Q<n>"}, status=400)
+
+    # 1️⃣ Every quarter must be parsed already (else queued); union of sheet columns
+    parsed_events, columns, pending = [], [], []
+    for event in events:
+        try:
+            parsed = require_parse(event)
+        except FileNotFoundError:
+            continue
+        except EventTableNotParsed:
+            pending.append(quarter_label(event))
+            continue
+        parsed_events.append(event)
+        columns.extend(column for column in parsed.columns if column not in columns)
+
+    if pending:
+        return processing_response(pending)
+
+    if not parsed_events:
+        return Response({"error": "Event table not found"}, status=404)
+
+    selected = _split(request.GET.get("columns"))
+    unknown = [column for column in selected if column not in columns]
+    if unknown:
+        return Response({"error": f"Unknown columns: {', '.join(unknown)}"}, status=400)
+    columns = selected or columns
+
+    filters = {
+        field: request.GET[field]
+        for field in ROW_FILTERS
+        if request.GET.get(field)
+    }
+
+    # 2️⃣ Build (lazy) querysets up front so bad filters fail before streaming
+    try:
+        querysets = [
+            (event, filter_event_rows(
+                EventRow.objects.filter(event_table=event),
+                columns,
+                filters,
+                _split(request.GET.get("sort")),
+            ))
+            for event in parsed_events
+        ]
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    def rows():
+        for event, queryset in querysets:
+            for data in queryset.values_list("data", flat=True).iterator(chunk_size=2000):
+                yield [event.year, event.quarter] + [data.get(column, "") for column in columns]
+
+    return export_response(
+        filetype,
+        f"swfp-event-table-{_range_label(request.GET)}",
+        ["Year", "Quarter"] + columns,
+        rows(),
+        title="Event table",
+    )
+
+
+@api_view(["GET"])
+def export_verification_stats(request):
+    """
+    GET /api/swfp_evaluation/verification/export/?filetype=csv&from=2024-Q1&group_by=quarter,hazard
+    """
+    try:
+        filetype = _filetype(request)
+        events, group_by, filters = parse_verification_params(request.GET)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    overall, results, _, pending = verification_stats(events, group_by, filters)
+    if pending:
+        return processing_response(pending)
+    if not group_by:
+        results = [overall]
+    header = list(group_by) + list(COUNT_FIELDS) + list(SCORE_FIELDS)
+
+    return export_response(
+        filetype,
+        f"swfp-verification-{_range_label(request.GET)}",
+        header,
+        ([result[field] for field in header] for result in results),
+        title="Verification",
+    )
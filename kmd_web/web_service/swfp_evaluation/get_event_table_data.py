@@ -1,9 +1,30 @@
-import pandas as pd
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from django.conf import settings
+from django.core.paginator import EmptyPage, Paginator
+from django.http import HttpResponse
 import os
+from forecasts.services.file_serving import file_validators, not_modified, set_validators
 from .models import EventTable
+from .services.event_tables import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ROW_FILTERS,
+    EventTableNotParsed,
+    event_table_path,
+    get_event_table_payload,
+    processing_response,
+    project_rows,
+    quarter_label,
+    query_event_rows,
+    require_parse,
+)
+
+# Any of these switches the endpoint from "whole sheet" to paged rows
+PAGED_PARAMS = ("page", "page_size", "columns", "sort") + ROW_FILTERS
+
+
+def _split(value):
+    return [part.strip() for part in value.split(",") if part.strip()] if value else []
 
 @api_view(["GET"])
 def get_event_table_data(request):
@@ -28,28 +49,77 @@ def get_event_table_data(request):
     if not event:
         return Response({"error": "Event table not found"}, status=404)
 
-    file_path = os.path.join(settings.MEDIA_ROOT, event.file_path)
+    file_path = event_table_path(event)
 
     if not os.path.exists(file_path):
         return Response({"error": "File missing on disk"}, status=404)
 
-    # 🔑 Read with pandas
-    try:
-        file_ext = os.path.splitext(file_path)[1].lower()
+    # 304 straight from stat() — skips pd.read_excel entirely
+    etag, last_modified = file_validators(file_path, event.pk)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
 
-        if file_ext == ".xls":
-            df = pd.read_excel(file_path, engine="xlrd")  # old Excel format
+    paged = any(param in request.GET for param in PAGED_PARAMS)
+
+    # 🔑 Parsed once at registration (Celery); a new/changed file is queued
+    try:
+        if not paged:
+            payload = get_event_table_payload(event, os.stat(file_path))
         else:
-            df = pd.read_excel(file_path, engine="openpyxl")  # modern Excel format
-        #df = pd.read_excel(file_path)
+            parsed = require_parse(event, os.stat(file_path))
+    except EventTableNotParsed:
+        return processing_response([quarter_label(event)])
     except Exception as e:
         return Response({"error": f"Failed to read Excel: {str(e)}"}, status=500)
 
-    # Convert to JSON-friendly format
-    data = df.fillna("").to_dict(orient="records")
-    columns = list(df.columns)
+    if not paged:
+        # Stored JSON goes out as-is, no decode / re-render
+        response = HttpResponse(payload, content_type="application/json")
+        return set_validators(response, etag, last_modified)
+
+    # 📄 Paged / filtered / projected rows straight from EventRow
+    try:
+        page_number = int(request.GET.get("page", 1))
+        page_size = min(int(request.GET.get("page_size", DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        if page_number < 1 or page_size < 1:
+            raise ValueError
+    except ValueError:
+        return Response({"error": "Invalid page or page_size"}, status=400)
+
+    columns = parsed.columns
+    selected = _split(request.GET.get("columns"))
+    unknown = [column for column in selected if column not in columns]
+    if unknown:
+        return Response({"error": f"Unknown columns: {', '.join(unknown)}"}, status=400)
+
+    filters = {
+        field: request.GET[field]
+        for field in ROW_FILTERS
+        if request.GET.get(field)
+    }
+
+    try:
+        rows = query_event_rows(event, columns, filters, _split(request.GET.get("sort")))
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    paginator = Paginator(rows.values_list("data", flat=True), page_size)
+    try:
+        page = paginator.page(page_number)
+    except EmptyPage:
+        return Response({"error": "Page out of range"}, status=404)
+
+    # Projecting also restores sheet column order (jsonb does not keep it)
+    columns = selected or columns
+    page_rows = project_rows(page.object_list, columns)
 
-    return Response({
+    response = Response({
         "columns": columns,
-        "rows": data
-    })
\ No newline at end of file
+        "rows": page_rows,
+        "count": paginator.count,
+        "page": page.number,
+        "page_size": page_size,
+        "num_pages": paginator.num_pages,
+    })
+    return set_validators(response, etag, last_modified)
\ No newline at end of file
@@ -0,0 +1,66 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from .services.event_tables import _normalise, processing_response
+from .services.quarterly import event_tables_in_range
+from .services.verification import GROUP_FIELDS, verification_stats
+
+
+def parse_verification_params(params):
+    """
+    (events, group_by, filters) from the query string.
+    Raises ValueError with a client-facing message.
+    """
+    # 1️⃣ Quarter range (inclusive); defaults to every registered quarter
+    try:
+        events = event_tables_in_range(params.get("from"), params.get("to"))
+    except ValueError as e:
+        raise ValueError(f"Invalid quarter {e}, use YYYY-Q<n>")
+
+    # 2️⃣ Grouping and filters
+    group_by = [
+        field.strip() for field in params.get("group_by", "hazard").split(",")
+        if field.strip()
+    ]
+    invalid = [field for field in group_by if field not in GROUP_FIELDS]
+    if invalid:
+        raise ValueError(f"Invalid group_by. Available: {', '.join(GROUP_FIELDS)}")
+
+    # Stored values are _normalise()d ("Heavy-Rain" -> "heavy rain")
+    filters = {
+        field: _normalise(params[field])
+        for field in ("hazard", "country")
+        if params.get(field)
+    }
+    if params.get("lead_time"):
+        try:
+            filters["lead_time"] = int(params["lead_time"])
+        except ValueError:
+            raise ValueError("Invalid lead_time")
+
+    return list(events), group_by, filters
+
+
+@api_view(["GET"])
+def get_verification_stats(request):
+    """
+    GET /api/swfp_evaluation/verification/?from=2024-Q1&to=2025-Q4&group_by=hazard,lead_time&country=kenya
+    """
+    try:
+        events, group_by, filters = parse_verification_params(request.GET)
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
+
+    # 3️⃣ Per-quarter counts come from cache; only the sums are computed here
+    overall, results, missing, pending = verification_stats(events, group_by, filters)
+    if pending:
+        return processing_response(pending)
+
+    return Response({
+        "quarters": [f"{e.year}-Q{e.quarter}" for e in events],
+        "group_by": group_by,
+        "filters": filters,
+        "overall": overall,
+        "results": results,
+        "missing": missing,
+    })
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from swfp_evaluation.models import EventTable
+from swfp_evaluation.services.verification import quarter_counts
+
+
+class Command(BaseCommand):
+    help = "Parse every active EventTable into EventRows and warm the verification cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, help="Only process this year")
+
+    def handle(self, *args, **options):
+        events = EventTable.objects.filter(is_active=True)
+        if options["year"]:
+            events = events.filter(year=options["year"])
+
+        parsed = failed = 0
+        for event in events.order_by("year", "quarter"):
+            try:
+                quarter_counts(event, parse=True)  # parses when missing/stale, then caches
+                parsed += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"{event}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {parsed} event table(s), {failed} failed."
+        ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from swfp_evaluation.services.quarterly import register_quarterly_artifacts
+
+
+class Command(BaseCommand):
+    help = "Register quarterly reports and event tables found under MEDIA_ROOT/rsmc/<year>/quarter_<n>/"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, help="Only scan rsmc/<year>/")
+
+    def handle(self, *args, **options):
+        registered = register_quarterly_artifacts(options["year"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Registered {registered['quarterlyreport']} quarterly report(s) "
+            f"and {registered['eventtable']} event table(s)."
+        ))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swfp_evaluation', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParsedEventTable',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_mtime_ns', models.BigIntegerField()),
+                ('source_size', models.BigIntegerField()),
+                ('columns', models.JSONField(default=list)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('payload', models.TextField()),
+                ('parsed_at', models.DateTimeField(auto_now=True)),
+                ('event_table', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='parsed', to='swfp_evaluation.eventtable')),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def clear_parsed_tables(apps, schema_editor):
+    # Force a re-parse so existing sheets get their EventRows
+    apps.get_model("swfp_evaluation", "ParsedEventTable").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swfp_evaluation', '0002_parsedeventtable'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('row_number', models.PositiveIntegerField()),
+                ('country', models.CharField(blank=True, max_length=100)),
+                ('hazard', models.CharField(blank=True, max_length=100)),
+                ('outcome', models.CharField(blank=True, choices=[('hit', 'Hit'), ('miss', 'Miss'), ('false_alarm', 'False Alarm'), ('correct_negative', 'Correct Negative'), ('', 'Unknown')], max_length=20)),
+                ('lead_time', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('data', models.JSONField(default=dict)),
+                ('event_table', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_rows', to='swfp_evaluation.eventtable')),
+            ],
+            options={
+                'ordering': ['event_table', 'row_number'],
+                'indexes': [models.Index(fields=['event_table', 'country'], name='swfp_evalua_event_t_c6dede_idx'), models.Index(fields=['event_table', 'hazard'], name='swfp_evalua_event_t_ce9823_idx'), models.Index(fields=['event_table', 'outcome'], name='swfp_evalua_event_t_e92a15_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event_table', 'row_number'), name='unique_event_row')],
+            },
+        ),
+        migrations.RunPython(clear_parsed_tables, migrations.RunPython.noop),
+    ]
@@ -43,4 +43,80 @@ class EventTable(models.Model):
 
     def get_file_url(self):
         from django.conf import settings
-        return f"{settings.MEDIA_URL}{self.file_path}"
\ No newline at end of file
+        return f"{settings.MEDIA_URL}{self.file_path}"
+
+class ParsedEventTable(models.Model):
+    """
+    EventTable sheet parsed once with pandas. `payload` is the ready-to-send
+    {"columns": [...], "rows": [...]} JSON; it is rebuilt only when the
+    source file's mtime or size changes.
+    """
+    event_table = models.OneToOneField(
+        EventTable,
+        on_delete=models.CASCADE,
+        related_name="parsed"
+    )
+
+    source_mtime_ns = models.BigIntegerField()
+    source_size = models.BigIntegerField()
+
+    columns = models.JSONField(default=list)
+    row_count = models.PositiveIntegerField(default=0)
+    payload = models.TextField()
+
+    parsed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Parsed {self.event_table}"
+
+    def is_current(self, stat):
+        return (
+            self.source_mtime_ns == stat.st_mtime_ns
+            and self.source_size == stat.st_size
+        )
+
+
+class EventRow(models.Model):
+    """
+    One row of a parsed EventTable sheet. The columns used for filtering,
+    sorting and verification are pulled out (lower-cased) and indexed;
+    `data` keeps the full row as it appears in the sheet.
+    """
+    OUTCOME_CHOICES = [
+        ("hit", "Hit"),
+        ("miss", "Miss"),
+        ("false_alarm", "False Alarm"),
+        ("correct_negative", "Correct Negative"),
+        ("", "Unknown"),
+    ]
+
+    event_table = models.ForeignKey(
+        EventTable,
+        on_delete=models.CASCADE,
+        related_name="event_rows"
+    )
+    row_number = models.PositiveIntegerField()
+
+    country = models.CharField(max_length=100, blank=True)
+    hazard = models.CharField(max_length=100, blank=True)
+    outcome = models.CharField(max_length=20, choices=OUTCOME_CHOICES, blank=True)
+    lead_time = models.PositiveSmallIntegerField(null=True, blank=True)  # days
+
+    data = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ["event_table", "row_number"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event_table", "row_number"],
+                name="unique_event_row"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["event_table", "country"]),
+            models.Index(fields=["event_table", "hazard"]),
+            models.Index(fields=["event_table", "outcome"]),
+        ]
+
+    def __str__(self):
+        return f"{self.event_table} - row {self.row_number}"
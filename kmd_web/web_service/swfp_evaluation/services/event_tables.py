@@ -0,0 +1,294 @@
+import json
+import os
+import re
+
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.fields.json import KeyTransform
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from swfp_evaluation.models import EventRow, EventTable, ParsedEventTable
+
+# Normalised header -> EventRow field. Headers are lower-cased with
+# punctuation collapsed to single spaces before lookup.
+COLUMN_ALIASES = {
+    "country": "country",
+    "member state": "country",
+    "hazard": "hazard",
+    "hazard type": "hazard",
+    "event": "hazard",
+    "event type": "hazard",
+    "outcome": "outcome",
+    "result": "outcome",
+    "verification": "outcome",
+    "hit miss": "outcome",
+    "observed": "observed",
+    "occurred": "observed",
+    "event observed": "observed",
+    "forecast": "forecast",
+    "forecasted": "forecast",
+    "warned": "forecast",
+    "lead": "lead_time",
+    "lead time": "lead_time",
+    "lead day": "lead_time",
+    "lead time days": "lead_time",
+}
+
+OUTCOME_ALIASES = {
+    "hit": "hit",
+    "miss": "miss",
+    "missed": "miss",
+    "false alarm": "false_alarm",
+    "fa": "false_alarm",
+    "correct negative": "correct_negative",
+    "correct rejection": "correct_negative",
+    "cn": "correct_negative",
+}
+
+YES = {"yes", "y", "true", "1", "x"}
+NO = {"no", "n", "false", "0"}
+
+
+def event_table_path(event):
+    return os.path.join(settings.MEDIA_ROOT, event.file_path)
+
+
+def read_event_table(file_path):
+    """Read an event-table sheet into (columns, rows) JSON-friendly lists."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".xls":
+        df = pd.read_excel(file_path, engine="xlrd")  # old Excel format
+    else:
+        df = pd.read_excel(file_path, engine="openpyxl")  # modern Excel format
+
+    rows = df.fillna("").to_dict(orient="records")
+    columns = list(df.columns)
+    return columns, rows
+
+
+def _normalise(value):
+    return re.sub(r"[^a-z0-9]+", " ", str(value).lower()).strip()
+
+
+def build_column_map(columns):
+    """EventRow field -> sheet column, for the first matching header of each."""
+    column_map = {}
+    for column in columns:
+        field = COLUMN_ALIASES.get(_normalise(column))
+        if field and field not in column_map:
+            column_map[field] = column
+    return column_map
+
+
+def _yes_no(value):
+    value = _normalise(value)
+    if value in YES:
+        return True
+    if value in NO:
+        return False
+    return None
+
+
+def row_outcome(row, column_map):
+    """hit / miss / false_alarm / correct_negative, or "" when undecidable."""
+    if "outcome" in column_map:
+        outcome = OUTCOME_ALIASES.get(_normalise(row.get(column_map["outcome"], "")))
+        if outcome:
+            return outcome
+
+    if "observed" in column_map and "forecast" in column_map:
+        observed = _yes_no(row.get(column_map["observed"], ""))
+        forecast = _yes_no(row.get(column_map["forecast"], ""))
+        if observed is not None and forecast is not None:
+            return {
+                (True, True): "hit",
+                (True, False): "miss",
+                (False, True): "false_alarm",
+                (False, False): "correct_negative",
+            }[(observed, forecast)]
+
+    return ""
+
+
+# EventRow.lead_time is a PositiveSmallIntegerField
+MAX_LEAD_TIME = 32767
+
+
+def _lead_time(value):
+    # Dates or IDs in the column ("20240101") are not lead times
+    match = re.search(r"\d+", str(value))
+    if not match:
+        return None
+    lead_time = int(match.group())
+    return lead_time if lead_time <= MAX_LEAD_TIME else None
+
+
+def build_event_rows(event, columns, rows):
+    column_map = build_column_map(columns)
+    return [
+        EventRow(
+            event_table=event,
+            row_number=number,
+            country=_normalise(row.get(column_map["country"], ""))[:100] if "country" in column_map else "",
+            hazard=_normalise(row.get(column_map["hazard"], ""))[:100] if "hazard" in column_map else "",
+            outcome=row_outcome(row, column_map),
+            lead_time=_lead_time(row.get(column_map["lead_time"], "")) if "lead_time" in column_map else None,
+            data=row,
+        )
+        for number, row in enumerate(rows, start=1)
+    ]
+
+
+def parse_event_table(event, stat=None):
+    """
+    Parse `event`'s sheet and store the result, unless the stored copy
+    already matches the file on disk. Returns the ParsedEventTable.
+    """
+    file_path = event_table_path(event)
+    stat = stat or os.stat(file_path)
+
+    parsed = ParsedEventTable.objects.filter(event_table=event).first()
+    if parsed and parsed.is_current(stat):
+        return parsed
+
+    columns, rows = read_event_table(file_path)
+
+    # DRF's encoder: same output the endpoint produced when it parsed per request
+    payload = json.dumps({"columns": columns, "rows": rows}, cls=JSONEncoder)
+    decoded = json.loads(payload)
+    columns, rows = decoded["columns"], decoded["rows"]
+
+    with transaction.atomic():
+        # Serialise parses of one sheet (task vs request, or two requests);
+        # whoever waited finds the other's result already stored
+        EventTable.objects.select_for_update().filter(pk=event.pk).first()
+        parsed = ParsedEventTable.objects.filter(event_table=event).first()
+        if parsed and parsed.is_current(stat):
+            return parsed
+
+        parsed, _ = ParsedEventTable.objects.update_or_create(
+            event_table=event,
+            defaults={
+                "source_mtime_ns": stat.st_mtime_ns,
+                "source_size": stat.st_size,
+                "columns": columns,
+                "row_count": len(rows),
+                "payload": payload,
+            }
+        )
+        EventRow.objects.filter(event_table=event).delete()
+        EventRow.objects.bulk_create(
+            build_event_rows(event, columns, rows),
+            batch_size=1000,
+        )
+
+    return parsed
+
+
+# Polls of a sheet still being parsed don't queue it again
+PARSE_PENDING = 60 * 5
+PARSE_RETRY_AFTER = 10
+
+
+class EventTableNotParsed(Exception):
+    """The sheet on disk has no current parse; one has been queued."""
+
+
+def queue_parse(event):
+    from swfp_evaluation.tasks import parse_event_table_task
+
+    if cache.add(f"swfp:parse-pending:{event.pk}", True, PARSE_PENDING):
+        parse_event_table_task.delay(event.pk)
+
+
+def _current(event, stat):
+    return ParsedEventTable.objects.filter(
+        event_table=event,
+        source_mtime_ns=stat.st_mtime_ns,
+        source_size=stat.st_size,
+    )
+
+
+def require_parse(event, stat=None):
+    """
+    The stored parse (without its payload) for the request path. A
+    missing or stale parse is queued for Celery, never run inline:
+    raises EventTableNotParsed.
+    """
+    stat = stat or os.stat(event_table_path(event))
+    parsed = _current(event, stat).defer("payload").first()
+    if parsed is None:
+        queue_parse(event)
+        raise EventTableNotParsed(event)
+    return parsed
+
+
+def get_event_table_payload(event, stat):
+    """Stored JSON for the sheet; see require_parse for a missing/stale one."""
+    payload = _current(event, stat).values_list("payload", flat=True).first()
+    if payload is None:
+        queue_parse(event)
+        raise EventTableNotParsed(event)
+    return payload
+
+
+def processing_response(quarters):
+    """202 for sheets still being parsed; the client polls back."""
+    response = Response({"status": "processing", "quarters": quarters}, status=202)
+    response["Retry-After"] = str(PARSE_RETRY_AFTER)
+    return response
+
+
+def quarter_label(event):
+    return f"{event.year}-Q{event.quarter}"
+
+
+ROW_FILTERS = ("country", "hazard", "outcome")
+SORT_FIELDS = ("row_number", "country", "hazard", "outcome", "lead_time")
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+
+
+def query_event_rows(event, columns, filters=None, sort=None):
+    """EventRow queryset for one sheet; see filter_event_rows."""
+    return filter_event_rows(
+        EventRow.objects.filter(event_table=event), columns, filters, sort
+    )
+
+
+def filter_event_rows(rows, columns, filters=None, sort=None):
+    """
+    Apply API filters to an EventRow queryset. `filters` maps
+    country/hazard/outcome to a value; `sort` is a list of field or
+    sheet-column names, each optionally prefixed with "-".
+    Raises ValueError on unknown names.
+    """
+    for field, value in (filters or {}).items():
+        if field not in ROW_FILTERS:
+            raise ValueError(f"Unknown filter: {field}")
+        rows = rows.filter(**{field: _normalise(value) if field != "outcome" else value})
+
+    ordering = []
+    for key in sort or []:
+        desc, name = key.startswith("-"), key.lstrip("-")
+        if name in SORT_FIELDS:
+            expression = F(name)
+        elif name in columns:
+            # Headers may contain spaces or "__", so no string lookup
+            expression = KeyTransform(name, "data")
+        else:
+            raise ValueError(f"Unknown sort column: {name}")
+        ordering.append(expression.desc() if desc else expression.asc())
+
+    # row_number last keeps pages stable when the sort keys tie
+    return rows.order_by(*ordering, "row_number")
+
+
+def project_rows(rows, columns):
+    """Keep only `columns` (in that order) from each row dict."""
+    return [{column: row.get(column, "") for column in columns} for row in rows]
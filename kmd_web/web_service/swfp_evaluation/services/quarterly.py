@@ -0,0 +1,164 @@
+import re
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from forecasts.services.file_serving import row_validators
+from swfp_evaluation.models import EventTable, QuarterlyReport
+
+CACHE_TIMEOUT = 60 * 60 * 24
+MISS_TIMEOUT = 60 * 5  # registration clears it anyway; this only bounds drift
+
+# model -> (folder under rsmc/<year>/quarter_<n>/, accepted extensions)
+ARTIFACTS = {
+    QuarterlyReport: ("quarter-report", (".pdf",)),
+    EventTable: ("event-table", (".xls", ".xlsx")),
+}
+
+QUARTER_DIR_RE = re.compile(r"^quarter_([1-4])$")
+QUARTER_PARAM_RE = re.compile(r"^(\d{4})-?Q([1-4])$", re.IGNORECASE)
+
+
+def artifact_cache_key(model, year, quarter):
+    return f"swfp:artifact:{model._meta.model_name}:{year}:{quarter}"
+
+
+def clear_artifact_cache(model, year, quarter):
+    cache.delete(artifact_cache_key(model, year, quarter))
+
+
+def get_artifact(model, year, quarter):
+    """
+    Cached {"file", "etag", "last_modified"} for the active artifact of a
+    quarter, or None. One indexed query on a cache miss; no disk access.
+    """
+    key = artifact_cache_key(model, year, quarter)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached or None  # {} marks a known miss
+
+    row = model.objects.filter(year=year, quarter=quarter, is_active=True).first()
+    if row is None:
+        cache.set(key, {}, MISS_TIMEOUT)
+        return None
+
+    etag, last_modified = row_validators(row)
+    artifact = {
+        "file": row.get_file_url(),
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+    cache.set(key, artifact, CACHE_TIMEOUT)
+    return artifact
+
+
+def parse_quarter(value):
+    """"2025-Q1" / "2025Q1" -> (2025, 1); ValueError otherwise."""
+    match = QUARTER_PARAM_RE.match(value.strip())
+    if not match:
+        raise ValueError(value)
+    return int(match.group(1)), int(match.group(2))
+
+
+def event_tables_in_range(start=None, end=None):
+    """
+    Active EventTables between two "YYYY-Q<n>" bounds (inclusive, either
+    optional), oldest first. Raises ValueError on a malformed bound.
+    """
+    events = EventTable.objects.filter(is_active=True).order_by("year", "quarter")
+    if start:
+        year, quarter = parse_quarter(start)
+        events = events.filter(Q(year__gt=year) | Q(year=year, quarter__gte=quarter))
+    if end:
+        year, quarter = parse_quarter(end)
+        events = events.filter(Q(year__lt=year) | Q(year=year, quarter__lte=quarter))
+    return events
+
+
+def discover_artifacts(model, year=None):
+    """
+    Yield (year, quarter, relative_path) for files laid out as
+    rsmc/<year>/quarter_<n>/<folder>/<file>; first file by name wins.
+    """
+    folder, extensions = ARTIFACTS[model]
+    media_root = Path(settings.MEDIA_ROOT)
+    base = media_root / "rsmc"
+    years = [base / str(year)] if year else sorted(base.glob("[0-9]" * 4))
+
+    for year_dir in years:
+        if not year_dir.is_dir():
+            continue
+        for quarter_dir in sorted(year_dir.iterdir()):
+            match = QUARTER_DIR_RE.match(quarter_dir.name)
+            if not match:
+                continue
+
+            files = sorted(
+                path for path in (quarter_dir / folder).glob("*")
+                if path.is_file() and path.suffix.lower() in extensions
+            )
+            if files:
+                yield (
+                    int(year_dir.name),
+                    int(match.group(1)),
+                    files[0].relative_to(media_root).as_posix(),
+                )
+
+
+def register_artifacts(model, year=None):
+    """
+    Register every quarter found on disk that has no row yet. Safe to run
+    concurrently or repeatedly: unique_together + ignore_conflicts make
+    the insert idempotent. Returns the newly registered rows.
+    """
+    found = list(discover_artifacts(model, year))
+    if not found:
+        return []
+
+    existing = set(model.objects.values_list("year", "quarter"))
+    today = date.today()
+
+    model.objects.bulk_create(
+        [
+            model(
+                year=found_year,
+                quarter=quarter,
+                title=Path(relative_path).name,
+                file_path=relative_path,
+                issue_date=today,
+                is_active=True,
+            )
+            for found_year, quarter, relative_path in found
+            if (found_year, quarter) not in existing
+        ],
+        ignore_conflicts=True,
+    )
+
+    # bulk_create sends no post_save, so do the signal handlers' work here
+    new_keys = {(y, q) for y, q, _ in found} - existing
+    created = [
+        row for row in model.objects.filter(year__in={y for y, _ in new_keys})
+        if (row.year, row.quarter) in new_keys
+    ]
+    for row in created:
+        clear_artifact_cache(model, row.year, row.quarter)
+
+    if model is EventTable and created:
+        from swfp_evaluation.tasks import parse_event_table_task
+
+        for row in created:
+            transaction.on_commit(lambda pk=row.pk: parse_event_table_task.delay(pk))
+
+    return created
+
+
+def register_quarterly_artifacts(year=None):
+    """Register quarterly reports and event tables; returns {model_name: count}."""
+    return {
+        model._meta.model_name: len(register_artifacts(model, year))
+        for model in ARTIFACTS
+    }
@@ -0,0 +1,147 @@
+import os
+
+import numpy as np
+import pandas as pd
+from django.core.cache import cache
+from django.db.models import Count
+
+from swfp_evaluation.models import EventRow
+from swfp_evaluation.services.event_tables import (
+    EventTableNotParsed,
+    event_table_path,
+    parse_event_table,
+    quarter_label,
+    require_parse,
+)
+
+GROUP_FIELDS = ("quarter", "hazard", "country", "lead_time")
+COUNT_FIELDS = ("hits", "misses", "false_alarms", "correct_negatives")
+OUTCOME_COUNTS = {
+    "hit": "hits",
+    "miss": "misses",
+    "false_alarm": "false_alarms",
+    "correct_negative": "correct_negatives",
+}
+CACHE_TIMEOUT = 60 * 60 * 24 * 7  # keys are versioned by source file, so this is just eviction
+
+
+def _cache_key(event, parsed):
+    return (
+        f"swfp:verification:{event.pk}:"
+        f"{parsed.source_mtime_ns}:{parsed.source_size}"
+    )
+
+
+def quarter_counts(event, parse=False):
+    """
+    Contingency counts for one EventTable at full granularity
+    (hazard x country x lead_time), as a list of records.
+    Cached per quarter until the sheet on disk changes. Unless `parse`
+    (management command), an unparsed sheet raises EventTableNotParsed.
+    """
+    stat = os.stat(event_table_path(event))
+    parsed = parse_event_table(event, stat) if parse else require_parse(event, stat)
+    key = _cache_key(event, parsed)
+
+    records = cache.get(key)
+    if records is not None:
+        return records
+
+    grouped = (
+        EventRow.objects
+        .filter(event_table=event)
+        .exclude(outcome="")
+        .values("hazard", "country", "lead_time", "outcome")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+    df = pd.DataFrame.from_records(
+        list(grouped),
+        columns=["hazard", "country", "lead_time", "outcome", "n"],
+    )
+    df["outcome"] = df["outcome"].map(OUTCOME_COUNTS)
+
+    counts = (
+        df.groupby(["hazard", "country", "lead_time", "outcome"], dropna=False)["n"]
+        .sum()
+        .unstack("outcome", fill_value=0)
+        .reindex(columns=list(COUNT_FIELDS), fill_value=0)
+        .reset_index()
+    )
+    counts["lead_time"] = counts["lead_time"].astype("Int64")
+    counts["quarter"] = f"{event.year}-Q{event.quarter}"
+
+    records = counts.astype(object).where(counts.notna(), None).to_dict(orient="records")
+    cache.set(key, records, CACHE_TIMEOUT)
+    return records
+
+
+def contingency_scores(df):
+    """Add POD, FAR, CSI and frequency bias columns to a frame of counts."""
+    hits = df["hits"].to_numpy(dtype=float)
+    misses = df["misses"].to_numpy(dtype=float)
+    false_alarms = df["false_alarms"].to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df["pod"] = hits / (hits + misses)
+        df["far"] = false_alarms / (hits + false_alarms)
+        df["csi"] = hits / (hits + misses + false_alarms)
+        df["bias"] = (hits + false_alarms) / (hits + misses)
+
+    # Bias is infinite for false alarms on a never-observed event; undefined either way
+    df.replace([np.inf, -np.inf], np.nan, inplace=True)
+    return df
+
+
+def _records(df):
+    scores = ["pod", "far", "csi", "bias"]
+    df[scores] = df[scores].round(4)
+    # NaN (0/0) -> null in the JSON
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+def verification_stats(events, group_by, filters=None):
+    """
+    Sum per-quarter counts across `events` and score them, grouped by
+    any of GROUP_FIELDS. Returns (overall, results, missing, pending)
+    where `missing` lists quarters whose sheet could not be read and
+    `pending` those queued for parsing.
+    """
+    records, missing, pending = [], [], []
+    for event in events:
+        try:
+            records.extend(quarter_counts(event))
+        except EventTableNotParsed:
+            pending.append(quarter_label(event))
+        except FileNotFoundError:
+            missing.append({
+                "quarter": f"{event.year}-Q{event.quarter}",
+                "error": "File missing on disk",
+            })
+        except Exception as e:
+            missing.append({
+                "quarter": f"{event.year}-Q{event.quarter}",
+                "error": str(e),
+            })
+
+    df = pd.DataFrame.from_records(records, columns=list(GROUP_FIELDS) + list(COUNT_FIELDS))
+    df["lead_time"] = df["lead_time"].astype("Int64")
+    for field, value in (filters or {}).items():
+        df = df[df[field] == value]
+
+    totals = df[list(COUNT_FIELDS)].sum().to_frame().T.astype(int)
+    overall = _records(contingency_scores(totals))[0]
+
+    if group_by:
+        grouped = (
+            df.groupby(list(group_by), dropna=False)[list(COUNT_FIELDS)]
+            .sum()
+            .reset_index()
+            .sort_values(list(group_by), na_position="last")
+        )
+        results = _records(contingency_scores(grouped))
+    else:
+        results = []
+
+    return overall, results, missing, pending
@@ -0,0 +1,33 @@
+#swfp_evaluation/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import EventTable, QuarterlyReport
+from .services.quarterly import clear_artifact_cache
+from .tasks import parse_event_table_task
+
+
+@receiver(post_save, sender=EventTable)
+def queue_event_table_parse(sender, instance, **kwargs):
+    """Parse the sheet when it is registered, not on the first GET."""
+    event_table_id = instance.pk
+    transaction.on_commit(lambda: parse_event_table_task.delay(event_table_id))
+
+
+@receiver(pre_save, sender=QuarterlyReport)
+@receiver(pre_save, sender=EventTable)
+def clear_previous_artifact(sender, instance, **kwargs):
+    # Admin edits can move a row to another quarter; drop the old key too
+    if instance.pk:
+        previous = sender.objects.filter(pk=instance.pk).values_list("year", "quarter").first()
+        if previous:
+            clear_artifact_cache(sender, *previous)
+
+
+@receiver(post_save, sender=QuarterlyReport)
+@receiver(post_delete, sender=QuarterlyReport)
+@receiver(post_save, sender=EventTable)
+@receiver(post_delete, sender=EventTable)
+def clear_cached_artifact(sender, instance, **kwargs):
+    clear_artifact_cache(sender, instance.year, instance.quarter)
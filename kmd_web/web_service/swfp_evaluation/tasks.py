@@ -0,0 +1,21 @@
+#swfp_evaluation/tasks.py
+from celery import shared_task
+from .models import EventTable
+from .services.event_tables import parse_event_table
+from .services.quarterly import register_quarterly_artifacts
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
+def parse_event_table_task(self, event_table_id):
+    event = EventTable.objects.filter(pk=event_table_id).first()
+    if event is None:
+        return f"Event table {event_table_id} no longer exists"
+
+    parsed = parse_event_table(event)
+    return f"Parsed {event} ({parsed.row_count} rows)"
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
+def register_quarterly_artifacts_task(self, year=None):
+    registered = register_quarterly_artifacts(year)
+    return f"Registered {registered}"
@@ -1,3 +1,80 @@
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+from datetime import date
+from unittest import mock
 
-# Create your tests here.
+import pandas as pd
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from .models import EventTable, ParsedEventTable
+from .services.event_tables import _lead_time, parse_event_table
+
+
+class EventTableTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        cache.clear()
+
+        relative_path = "rsmc/2025/quarter_1/event_tables/events.xlsx"
+        os.makedirs(os.path.join(self.media_root, os.path.dirname(relative_path)))
+        pd.DataFrame([
+            {"Country": "Kenya", "Hazard": "Heavy Rain", "Outcome": "Hit", "Lead Time": 1},
+            {"Country": "Kenya", "Hazard": "Heavy Rain", "Outcome": "Miss", "Lead Time": 2},
+            {"Country": "Uganda", "Hazard": "Strong Wind", "Outcome": "False Alarm", "Lead Time": 1},
+        ]).to_excel(os.path.join(self.media_root, relative_path), index=False)
+
+        self.event = EventTable.objects.create(
+            year=2025, quarter=1, title="Q1", file_path=relative_path, issue_date=date(2025, 3, 31),
+        )
+        # What parse_event_table_task does once the row is committed
+        parse_event_table(self.event)
+
+
+class VerificationFilterTests(EventTableTestCase):
+    def test_hazard_filter_is_normalised_like_stored_rows(self):
+        response = APIClient().get("/api/swfp_evaluation/verification/", {"hazard": "Heavy-RAIN"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["filters"], {"hazard": "heavy rain"})
+        self.assertEqual(response.data["overall"]["hits"], 1)
+        self.assertEqual(response.data["overall"]["misses"], 1)
+        self.assertEqual(response.data["overall"]["false_alarms"], 0)
+
+
+class UnparsedEventTableTests(EventTableTestCase):
+    def setUp(self):
+        super().setUp()
+        ParsedEventTable.objects.filter(event_table=self.event).delete()
+
+    @mock.patch("swfp_evaluation.tasks.parse_event_table_task.delay")
+    def test_requests_queue_the_parse_once_and_return_202(self, delay):
+        client = APIClient()
+        urls = [
+            "/api/swfp_evaluation/verification/",
+            "/api/swfp_evaluation/events-table-data/?year=2025&quarter=1&page=1",
+        ]
+        for url in urls:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.data, {"status": "processing", "quarters": ["2025-Q1"]})
+            self.assertEqual(response["Retry-After"], "10")
+
+        delay.assert_called_once_with(self.event.pk)
+        self.assertFalse(ParsedEventTable.objects.filter(event_table=self.event).exists())
+
+
+class LeadTimeTests(SimpleTestCase):
+    def test_first_number_is_the_lead_time(self):
+        self.assertEqual(_lead_time("Day 3"), 3)
+        self.assertEqual(_lead_time(2), 2)
+
+    def test_missing_or_out_of_range_is_none(self):
+        self.assertIsNone(_lead_time(""))
+        self.assertIsNone(_lead_time("20240101"))
@@ -1,9 +1,14 @@
 from django.urls import path
 from .views import get_quarterly_report, get_event_table
 from .get_event_table_data import get_event_table_data
+from .get_verification_stats import get_verification_stats
+from .export_data import export_event_rows, export_verification_stats
 
 urlpatterns = [
     path("reports/quarterly/", get_quarterly_report, name='quarterly-report'),
     path("events-table/", get_event_table, name='event-table'),
-    path("events-table-data/", get_event_table_data, name='event-table-data')
+    path("events-table-data/", get_event_table_data, name='event-table-data'),
+    path("events-table-data/export/", export_event_rows, name='event-table-export'),
+    path("verification/", get_verification_stats, name='verification-stats'),
+    path("verification/export/", export_verification_stats, name='verification-export'),
 ]
\ No newline at end of file
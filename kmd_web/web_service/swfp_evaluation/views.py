@@ -1,13 +1,12 @@
-import os
-from django.conf import settings
-from django.utils.timezone import now
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from forecasts.services.file_serving import not_modified, set_validators
 from .models import QuarterlyReport
 from .models import EventTable
+from .services.quarterly import get_artifact
 
-@api_view(["GET"])
-def get_quarterly_report(request):
+
+def _artifact_response(request, model, not_found):
     year = request.GET.get("year")
     quarter = request.GET.get("quarter")
 
@@ -20,131 +19,30 @@ def get_quarterly_report(request):
     except ValueError:
         return Response({"error": "Invalid parameters"}, status=400)
 
-    # 1️⃣ DB lookup
-    report = QuarterlyReport.objects.filter(
-        year=year,
-        quarter=quarter,
-        is_active=True
-    ).first()
-
-    if report:
-        return Response({
-            "file": report.get_file_url(),
-            "year": year,
-            "quarter": quarter
-        })
-
-    # 2️⃣ Filesystem fallback
-    base_dir = os.path.join(
-        settings.MEDIA_ROOT,
-        "rsmc",
-        str(year),
-        f"quarter_{quarter}",
-        "quarter-report"
-    )
-    #print("base url: year", year,'quarter:', quarter,"url:", base_dir)
-    if not os.path.exists(base_dir):
-        return Response({"error": "Directory not found"}, status=404)
-
-    pdf_files = [f for f in os.listdir(base_dir) if f.endswith(".pdf")]
-
-    if not pdf_files:
-        return Response({"error": "Quarterly report not found"}, status=404)
-
-    filename = pdf_files[0]
-    # full path on disk
-    full_path = os.path.join(base_dir, filename)
-
-    # compute path relative to MEDIA_ROOT
-    relative_path = os.path.relpath(full_path, settings.MEDIA_ROOT)
-    print("relative path:", relative_path)
-    #relative_path = f"rsmc/{year}/quarter_{quarter}/quarterlyreport/{filename}"
+    # 1️⃣ Cached row snapshot; artifacts are registered ahead of time by
+    # `manage.py register_quarterly_artifacts` / the beat task, never here
+    artifact = get_artifact(model, year, quarter)
+    if artifact is None:
+        return Response({"error": not_found}, status=404)
 
-    # 3️⃣ Save to DB
-    report = QuarterlyReport.objects.create(
-        year=year,
-        quarter=quarter,
-        title=filename,
-        file_path=relative_path,
-        issue_date=now().date(),
-        is_active=True
-    )
+    etag, last_modified = artifact["etag"], artifact["last_modified"]
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
 
-    return Response({
-        "file": report.get_file_url(),
+    response = Response({
+        "file": artifact["file"],
         "year": year,
         "quarter": quarter
     })
+    return set_validators(response, etag, last_modified)
 
 
 @api_view(["GET"])
-def get_event_table(request):
-    year = request.GET.get("year")
-    quarter = request.GET.get("quarter")
-
-    if not year or not quarter:
-        return Response({"error": "Missing parameters"}, status=400)
-
-    try:
-        year = int(year)
-        quarter = int(quarter)
-    except ValueError:
-        return Response({"error": "Invalid parameters"}, status=400)
-
-    # 1️⃣ DB lookup
-    event = EventTable.objects.filter(
-        year=year,
-        quarter=quarter,
-        is_active=True
-    ).first()
-
-    if event:
-        return Response({
-            "file": event.get_file_url(),
-            "year": year,
-            "quarter": quarter
-        })
-
-    # 2️⃣ Filesystem fallback
-    base_dir = os.path.join(
-        settings.MEDIA_ROOT,
-        "rsmc",
-        str(year),
-        f"quarter_{quarter}",
-        "event-table"
-    )
-
-    if not os.path.exists(base_dir):
-        return Response({"error": "Directory not found"}, status=404)
-
-    xls_files = [
-        f for f in os.listdir(base_dir)
-        if f.endswith(".xls") or f.endswith(".xlsx")
-    ]
-
-    if not xls_files:
-        return Response({"error": "Event table not found"}, status=404)
-
-    filename = xls_files[0]
-    # full path on disk
-    full_path = os.path.join(base_dir, filename)
-
-    # compute path relative to MEDIA_ROOT
-    relative_path = os.path.relpath(full_path, settings.MEDIA_ROOT)
-    #relative_path = f"rsmc/{year}/quarter_{quarter}/eventtable/{filename}"
+def get_quarterly_report(request):
+    return _artifact_response(request, QuarterlyReport, "Quarterly report not found")
 
-    # 3️⃣ Save to DB
-    event = EventTable.objects.create(
-        year=year,
-        quarter=quarter,
-        title=filename,
-        file_path=relative_path,
-        issue_date=now().date(),
-        is_active=True
-    )
 
-    return Response({
-        "file": event.get_file_url(),
-        "year": year,
-        "quarter": quarter
-    })
\ No newline at end of file
+@api_view(["GET"])
+def get_event_table(request):
+    return _artifact_response(request, EventTable, "Event table not found")
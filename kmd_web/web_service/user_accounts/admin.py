@@ -4,7 +4,7 @@ from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.forms import UserCreationForm
 from django import forms
 
-from .models import EmailVerification
+from .models import EmailDelivery, EmailVerification
 
 # ---------------------------------------------------------
 # CUSTOM USER CREATION FORM
@@ -72,4 +72,17 @@ class EmailVerificationAdmin(admin.ModelAdmin):
     search_fields = ("user__email", "user__username", "code")
     list_filter = ("created_at", "expires_at")
     readonly_fields = ("token", "created_at", "expires_at")
-    ordering = ("-created_at",)
\ No newline at end of file
+    ordering = ("-created_at",)
+
+
+# ---------------------------------------------------------
+# EMAIL DELIVERY ADMIN
+# ---------------------------------------------------------
+@admin.register(EmailDelivery)
+class EmailDeliveryAdmin(admin.ModelAdmin):
+    list_display = ("recipient", "email_type", "status", "attempts", "created_at", "sent_at")
+    search_fields = ("recipient", "user__email", "user__username")
+    list_filter = ("status", "email_type", "created_at")
+    readonly_fields = ("user", "recipient", "email_type", "subject", "created_at", "claimed_at", "sent_at", "status", "attempts", "error_message")
+    exclude = ("body", "html_body")  # may hold live reset links
+    ordering = ("-created_at",)
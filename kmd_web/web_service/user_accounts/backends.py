@@ -0,0 +1,17 @@
+from django.contrib.auth.backends import AllowAllUsersModelBackend
+
+
+class LoginBackend(AllowAllUsersModelBackend):
+    """
+    ModelBackend that still authenticates unverified (inactive) users, so
+    login_view can answer "not verified" from the one authenticate()
+    lookup. Sessions of inactive users are refused as usual.
+
+    Inherited behaviour relied on by login_view: a single user query,
+    the default hasher run for unknown usernames (same timing as a wrong
+    password), and password hashes upgraded when PASSWORD_HASHERS change.
+    """
+
+    def get_user(self, user_id):
+        user = super().get_user(user_id)
+        return user if user is not None and user.is_active else None
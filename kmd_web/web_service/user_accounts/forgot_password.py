@@ -11,6 +11,7 @@ from django.utils.http import urlsafe_base64_encode
 from django.views.decorators.csrf import csrf_protect
 from django.views.decorators.http import require_POST
 from .services.send_password_reset_email import send_password_reset_email
+from .services.rate_limit import rate_limit
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 @csrf_protect
 @require_POST
+@rate_limit("forgot_password", "email")
 def forgot_password(request):
     """
     Initiates password reset process.
@@ -48,7 +50,7 @@ def forgot_password(request):
                 f"{settings.FRONTEND_URL}/reset-password/{uid}/{token}/"
             )'''
 
-            send_password_reset_email(email, reset_url)
+            send_password_reset_email(user, reset_url)
 
           
 
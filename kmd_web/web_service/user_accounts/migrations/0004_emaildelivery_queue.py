@@ -0,0 +1,67 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:53
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_created_at(apps, schema_editor):
+    # Rows before the queue were sent synchronously: created == sent
+    EmailDelivery = apps.get_model("user_accounts", "EmailDelivery")
+    EmailDelivery.objects.update(created_at=models.F("sent_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_accounts', '0003_emailverification_used_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='body',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='html_body',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='recipient',
+            field=models.EmailField(blank=True, max_length=254),
+        ),
+        migrations.AddField(
+            model_name='emaildelivery',
+            name='subject',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='emaildelivery',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='emaildelivery',
+            name='status',
+            field=models.CharField(choices=[('queued', 'queued'), ('sent', 'sent'), ('failed', 'failed')], default='queued', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='emaildelivery',
+            index=models.Index(fields=['status', 'created_at'], name='user_accoun_status_65eea1_idx'),
+        ),
+        migrations.RunPython(backfill_created_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.12 on 2026-10-19 12:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_accounts', '0004_emaildelivery_queue'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailverification',
+            index=models.Index(fields=['code', '-created_at'], name='emailverif_code_recent'),
+        ),
+        migrations.AddIndex(
+            model_name='emailverification',
+            index=models.Index(condition=models.Q(('used_at__isnull', True)), fields=['user'], name='emailverif_user_unused'),
+        ),
+        migrations.AddIndex(
+            model_name='emailverification',
+            index=models.Index(fields=['expires_at'], name='emailverif_expires'),
+        ),
+        migrations.AddIndex(
+            model_name='emailverification',
+            index=models.Index(condition=models.Q(('used_at__isnull', False)), fields=['used_at'], name='emailverif_used'),
+        ),
+    ]
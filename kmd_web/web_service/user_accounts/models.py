@@ -20,6 +20,17 @@ class EmailVerification(models.Model):
     expires_at = models.DateTimeField()
     used_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # verify-code: latest row for a code
+            models.Index(fields=["code", "-created_at"], name="emailverif_code_recent"),
+            # token rotation / activation: a user's still-usable tokens
+            models.Index(fields=["user"], condition=models.Q(used_at__isnull=True), name="emailverif_user_unused"),
+            # housekeeping (user_accounts.tasks.purge_email_verifications)
+            models.Index(fields=["expires_at"], name="emailverif_expires"),
+            models.Index(fields=["used_at"], condition=models.Q(used_at__isnull=False), name="emailverif_used"),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.expires_at:
             self.expires_at = timezone.now() + timedelta(hours=24)
@@ -29,11 +40,30 @@ class EmailVerification(models.Model):
         return timezone.now() > self.expires_at
 
 class EmailDelivery(models.Model):
+    """
+    One outgoing email. Rows are created "queued" inside the request,
+    claimed as "sending" by a Celery task (user_accounts.tasks) and sent
+    outside any transaction; the message text is kept only until sent.
+    """
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     email_type = models.CharField(max_length=50)
-    sent_at = models.DateTimeField(auto_now_add=True)
+    recipient = models.EmailField(blank=True)
+    subject = models.CharField(max_length=255, blank=True)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
     status = models.CharField(
         max_length=20,
-        choices=[("sent","sent"), ("failed","failed")]
+        choices=[("queued","queued"), ("sending","sending"), ("sent","sent"), ("failed","failed")],
+        default="queued",
     )
-    error_message = models.TextField(null=True, blank=True)
\ No newline at end of file
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error_message = models.TextField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Sweep of queued rows left behind by a lost task
+            models.Index(fields=["status", "created_at"]),
+        ]
\ No newline at end of file
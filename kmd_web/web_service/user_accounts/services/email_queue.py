@@ -0,0 +1,144 @@
+"""
+Outgoing account emails are queued as EmailDelivery rows and sent by
+Celery over one SMTP connection per batch, so a slow SMTP server never
+holds a gunicorn worker.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from user_accounts.models import EmailDelivery
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+BATCH_SIZE = 100
+# Queued rows older than this are assumed to have lost their task
+STALE_AFTER = timedelta(minutes=5)
+
+
+def queue_email(user, email_type, subject, body, html_body="", recipient=None):
+    """Record the email and send it from Celery once the request commits."""
+    delivery = EmailDelivery.objects.create(
+        user=user,
+        email_type=email_type,
+        recipient=recipient or user.email,
+        subject=subject,
+        body=body,
+        html_body=html_body,
+    )
+    transaction.on_commit(lambda: _dispatch(delivery.pk))
+    return delivery
+
+
+def _dispatch(delivery_pk):
+    from user_accounts.tasks import send_email_deliveries
+
+    try:
+        send_email_deliveries.delay([delivery_pk])
+    except Exception:
+        # Broker unreachable: the row stays queued for the beat sweep
+        logger.exception("Could not queue email %s; leaving it for the sweep", delivery_pk)
+
+
+def build_message(delivery, connection):
+    message = EmailMultiAlternatives(
+        subject=delivery.subject,
+        body=delivery.body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[delivery.recipient],
+        connection=connection,
+    )
+    if delivery.html_body:
+        message.attach_alternative(delivery.html_body, "text/html")
+    return message
+
+
+def _claimable():
+    # Queued rows, or rows whose sender died mid-batch
+    return Q(status="queued") | Q(status="sending", claimed_at__lt=timezone.now() - STALE_AFTER)
+
+
+def claim(delivery_ids):
+    """
+    Mark the claimable deliveries among `delivery_ids` as "sending" and
+    return them. The lock (skip_locked) is held only for this update, so
+    a sweep and a task never pick up the same row.
+    """
+    with transaction.atomic():
+        deliveries = list(
+            EmailDelivery.objects
+            .select_for_update(skip_locked=True)
+            .filter(_claimable(), pk__in=delivery_ids)
+        )
+        claimed_at = timezone.now()
+        EmailDelivery.objects.filter(pk__in=[d.pk for d in deliveries]).update(
+            status="sending", claimed_at=claimed_at,
+        )
+    return deliveries
+
+
+def deliver(delivery_ids):
+    """
+    Claim the deliveries among `delivery_ids`, send them over one
+    connection and record each outcome. Returns (sent, retry_ids).
+
+    SMTP runs outside any transaction. Failing to connect at all hands
+    the claimed rows back to the queue and raises for the caller's retry.
+    """
+    sent, retry_ids = 0, []
+
+    deliveries = claim(delivery_ids)
+    if not deliveries:
+        return sent, retry_ids
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception:
+        EmailDelivery.objects.filter(pk__in=[d.pk for d in deliveries], status="sending").update(status="queued")
+        raise
+
+    try:
+        for delivery in deliveries:
+            delivery.attempts += 1
+            try:
+                connection.send_messages([build_message(delivery, connection)])
+            except Exception as exc:
+                logger.warning("Email %s to %s failed: %s", delivery.pk, delivery.recipient, exc)
+                connection.close()  # reconnect for the next message
+                delivery.error_message = str(exc)
+                if delivery.attempts >= MAX_ATTEMPTS:
+                    delivery.status = "failed"
+                else:
+                    delivery.status = "queued"
+                    retry_ids.append(delivery.pk)
+            else:
+                sent += 1
+                delivery.status = "sent"
+                delivery.sent_at = timezone.now()
+                delivery.error_message = None
+                # Links and codes are not kept once delivered
+                delivery.body = delivery.html_body = ""
+
+            delivery.save(update_fields=[
+                "status", "attempts", "sent_at", "error_message", "body", "html_body",
+            ])
+    finally:
+        connection.close()
+
+    return sent, retry_ids
+
+
+def stale_delivery_ids():
+    return list(
+        EmailDelivery.objects
+        .filter(_claimable(), attempts__lt=MAX_ATTEMPTS, created_at__lt=timezone.now() - STALE_AFTER)
+        .order_by("created_at")
+        .values_list("pk", flat=True)[:BATCH_SIZE * 10]
+    )
@@ -0,0 +1,137 @@
+"""
+Sliding-window rate limits for the auth endpoints, kept in Redis.
+
+Each (scope, ip) and (scope, account) pair is a sorted set of request
+timestamps; one Lua call trims the window, counts, and records the hit
+only when it is allowed. The check wraps the whole view, DRF's dispatch
+included, so it runs before authentication loads the session or user
+and before any password hashing: a credential-stuffing burst costs one
+Redis round trip per request. If Redis is unreachable it fails open.
+"""
+import functools
+import hashlib
+import json
+import logging
+import time
+import uuid
+
+import redis
+from django.conf import settings
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+# scope -> {"ip": [(limit, window seconds), ...], "account": [...]}
+DEFAULT_LIMITS = {
+    "login": {"ip": [(20, 300)], "account": [(10, 900)]},
+    "register": {"ip": [(10, 3600)], "account": [(5, 3600)]},
+    # 60 s cooldown plus an hourly cap per address
+    "resend": {"ip": [(10, 3600)], "account": [(1, 60), (5, 3600)]},
+    "forgot_password": {"ip": [(10, 3600)], "account": [(3, 3600)]},
+}
+
+# KEYS[1] = zset; ARGV = now_ms, window_ms, limit, member
+# Returns 0 when allowed, else milliseconds until the oldest hit expires
+SLIDING_WINDOW = """
+local now, window, limit = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    return math.max(1, tonumber(oldest[2]) + window - now)
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('PEXPIRE', KEYS[1], window)
+return 0
+"""
+
+_client = None
+_script = None
+
+
+def _get_script():
+    global _client, _script
+    if _script is None:
+        url = getattr(settings, "RATE_LIMIT_REDIS_URL", settings.REDIS_URL)
+        _client = redis.Redis.from_url(url, socket_timeout=1)
+        _script = _client.register_script(SLIDING_WINDOW)
+    return _script
+
+
+def client_ip(request):
+    # Behind nginx over a unix socket REMOTE_ADDR is empty; proxy_params
+    # sets X-Real-IP (see RATE_LIMIT_IP_HEADER)
+    header = getattr(settings, "RATE_LIMIT_IP_HEADER", "REMOTE_ADDR")
+    return request.META.get(header) or request.META.get("REMOTE_ADDR") or "unknown"
+
+
+def hit(scope, kind, identifier, limit, window):
+    """Record one request; returns seconds to wait, or 0 if allowed."""
+    digest = hashlib.sha1(identifier.encode()).hexdigest()
+    key = f"ratelimit:{scope}:{kind}:{digest}"
+    try:
+        wait_ms = _get_script()(
+            keys=[key],
+            args=[int(time.time() * 1000), window * 1000, limit, uuid.uuid4().hex],
+        )
+    except redis.RedisError:
+        logger.warning("ratelimit: redis unavailable, allowing %s", scope, exc_info=True)
+        return 0
+    return -(-int(wait_ms) // 1000)  # ceil
+
+
+def check(scope, ip, account=None):
+    """Seconds until `scope` may be retried by this ip/account, 0 if allowed."""
+    limits = getattr(settings, "AUTH_RATE_LIMITS", DEFAULT_LIMITS)[scope]
+
+    identifiers = [("ip", ip)]
+    if account:
+        # Account first: a locked account does not use up the IP's budget
+        identifiers.insert(0, ("account", account.strip().lower()))
+
+    for kind, identifier in identifiers:
+        for limit, window in limits.get(kind, ()):
+            wait = hit(scope, f"{kind}:{window}", identifier, limit, window)
+            if wait:
+                return wait
+    return 0
+
+
+def _account(request, field):
+    # Runs ahead of DRF's parsers, so read the raw body; Django keeps
+    # it buffered for the view
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    else:
+        data = request.POST
+    value = data.get(field) if hasattr(data, "get") else None
+    return value if isinstance(value, str) else None
+
+
+def rate_limit(scope, account_field=None):
+    """
+    Reject with 429 + Retry-After before the view runs. Goes above
+    @api_view, so DRF never authenticates a throttled request; on a
+    plain JSON view it goes directly on the function.
+    """
+    def decorator(view):
+        # DRF views answer errors as {"non_field_errors": [...]}
+        drf_view = hasattr(view, "cls")
+
+        @functools.wraps(view)
+        def wrapped(request, *args, **kwargs):
+            account = _account(request, account_field) if account_field else None
+            wait = check(scope, client_ip(request), account)
+            if not wait:
+                return view(request, *args, **kwargs)
+
+            message = f"Too many attempts. Try again in {wait} seconds."
+            payload = {"non_field_errors": [message]} if drf_view else {"detail": message}
+            response = JsonResponse(payload, status=429)
+            response["Retry-After"] = str(wait)
+            return response
+
+        return wrapped
+    return decorator
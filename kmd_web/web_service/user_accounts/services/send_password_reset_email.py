@@ -1,8 +1,7 @@
-from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from user_accounts.services.email_queue import queue_email
 
 
-def send_password_reset_email(user_email, reset_url):
+def send_password_reset_email(user, reset_url):
     subject = "Password Reset Request"
 
     text_content = (
@@ -28,12 +27,11 @@ def send_password_reset_email(user_email, reset_url):
     <p>If you did not request this, ignore this email.</p>
     """
 
-    email_message = EmailMultiAlternatives(
+    # Sent by Celery after commit; the request does not wait for SMTP
+    queue_email(
+        user,
+        "password_reset",
         subject=subject,
         body=text_content,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        to=[user_email],
+        html_body=html_content,
     )
-
-    email_message.attach_alternative(html_content, "text/html")
-    email_message.send(fail_silently=False)
\ No newline at end of file
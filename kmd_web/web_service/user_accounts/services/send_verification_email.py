@@ -1,5 +1,6 @@
-from django.core.mail import send_mail
 from user_accounts.models import EmailVerification
+from user_accounts.services.email_queue import queue_email
+from user_accounts.services.verification_tokens import rotate_tokens
 from django.conf import settings
 from django.utils import timezone
 
@@ -9,23 +10,16 @@ logger = logging.getLogger(__name__)
 
 def send_verification_email(user, link):
     try:
-        send_mail(
-            "Verify your email",
-            f"Click here: {link}",
-            "noreply@example.com",
-            [user.email],
-            fail_silently=False,
-        )
+        queue_email(user, "verification", "Verify your email", f"Click here: {link}")
         return True
 
     except Exception as e:
-        logger.error(f"Email send failed for {user.email}: {e}")
+        logger.error(f"Email queueing failed for {user.email}: {e}")
         return False
 
 def send_verification(user):
-    # delete old tokens
-    #EmailVerification.objects.filter(user=user).delete()
-
+    # Only the newest token stays usable; old rows are purged by beat
+    rotate_tokens(user)
 
     verification = EmailVerification.objects.create(user=user)
     #verification.used_at = timezone.now()
@@ -33,9 +27,12 @@ def send_verification(user):
 
     verification_link = f"{settings.FRONTEND_URL}/verify-email/{verification.token}"
 
-    send_mail(
+    # Sent by Celery after commit; the request does not wait for SMTP
+    queue_email(
+        user,
+        "verification",
         subject="Verify Your Account",
-        message=f"""
+        body=f"""
 Click the link below to verify your account:
 
 {verification_link}
@@ -43,8 +40,6 @@ Click the link below to verify your account:
 Verification code:
 {verification.code}
 """,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user.email],
     )
 
     return verification
\ No newline at end of file
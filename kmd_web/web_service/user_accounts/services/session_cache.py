@@ -0,0 +1,59 @@
+"""
+Who is logged in, answered from Redis: the session already lives in the
+cache, and a small per-user summary is cached next to it, so
+session_view never queries auth_user on an SPA page load.
+
+The summary carries the user's session auth hash; a password change or
+deactivation saves the user, which drops the entry (see signals.py), and
+any mismatch falls back to Django's full get_user() check.
+"""
+from django.contrib.auth import HASH_SESSION_KEY, SESSION_KEY, get_user
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare
+
+USER_TIMEOUT = 60 * 60
+
+
+def _key(user_id):
+    return f"session-user:{user_id}"
+
+
+def user_summary(user):
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "first_name": user.first_name,
+        "is_active": user.is_active,
+    }
+
+
+def cache_user(user):
+    summary = user_summary(user)
+    cache.set(_key(user.pk), {"summary": summary, "auth_hash": user.get_session_auth_hash()}, USER_TIMEOUT)
+    return summary
+
+
+def forget_user(user_id):
+    cache.delete(_key(user_id))
+
+
+def session_user(request):
+    """Summary of the session's user, or None when not logged in."""
+    user_id = request.session.get(SESSION_KEY)
+    if user_id is None:
+        return None
+
+    entry = cache.get(_key(user_id))
+    if (
+        entry is not None
+        and entry["summary"]["is_active"]
+        and constant_time_compare(entry["auth_hash"], request.session.get(HASH_SESSION_KEY, ""))
+    ):
+        return entry["summary"]
+
+    # Cold cache or stale session: full check (flushes a bad session)
+    user = get_user(request)
+    if not user.is_authenticated:
+        return None
+    return cache_user(user)
@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from user_accounts.models import EmailVerification
+
+CHUNK_SIZE = 1000
+
+
+def retention():
+    # Used/expired rows are kept a while so old links still get a clear
+    # "already verified" / "expired" answer instead of "invalid"
+    return timedelta(days=getattr(settings, "EMAIL_VERIFICATION_RETENTION_DAYS", 7))
+
+
+def rotate_tokens(user):
+    """Retire a user's unused tokens before a new one is issued."""
+    return EmailVerification.objects.filter(user=user, used_at__isnull=True).update(used_at=timezone.now())
+
+
+def purge_verifications(chunk_size=CHUNK_SIZE):
+    """
+    Delete tokens used or expired before the retention cutoff, a chunk
+    of primary keys at a time so no single DELETE holds long locks.
+    Returns the number of rows deleted.
+    """
+    cutoff = timezone.now() - retention()
+    stale = EmailVerification.objects.filter(Q(expires_at__lt=cutoff) | Q(used_at__lt=cutoff))
+
+    deleted = 0
+    while True:
+        ids = list(stale.values_list("pk", flat=True)[:chunk_size])
+        if not ids:
+            return deleted
+        count, _ = EmailVerification.objects.filter(pk__in=ids).delete()
+        deleted += count
@@ -0,0 +1,13 @@
+#user_accounts/signals.py
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .services.session_cache import forget_user
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_session_user(sender, instance, **kwargs):
+    # Password, is_active or profile changed: session_view re-checks
+    forget_user(instance.pk)
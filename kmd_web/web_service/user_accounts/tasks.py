@@ -0,0 +1,40 @@
+#user_accounts/tasks.py
+from celery import shared_task
+from django.core.management import call_command
+from .services.email_queue import BATCH_SIZE, deliver, stale_delivery_ids
+from .services.verification_tokens import purge_verifications
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30, retry_kwargs={'max_retries': 3})
+def send_email_deliveries(self, delivery_ids):
+    sent, retry_ids = deliver(delivery_ids)
+    if retry_ids:
+        # Only the messages the server rejected; the rest are done
+        raise self.retry(args=(retry_ids,), countdown=30 * 2 ** self.request.retries)
+    return f"Sent {sent} email(s)"
+
+
+@shared_task(bind=True)
+def send_queued_emails(self):
+    """Beat sweep: batch-send queued rows whose task was lost or gave up."""
+    delivery_ids = stale_delivery_ids()
+    sent = 0
+    for start in range(0, len(delivery_ids), BATCH_SIZE):
+        sent += deliver(delivery_ids[start:start + BATCH_SIZE])[0]
+    return f"Sent {sent} of {len(delivery_ids)} swept email(s)"
+
+
+@shared_task(bind=True)
+def purge_email_verifications(self):
+    """Beat housekeeping: drop used/expired verification tokens."""
+    return f"Deleted {purge_verifications()} email verification(s)"
+
+
+@shared_task(bind=True)
+def clear_expired_sessions(self):
+    """
+    Beat: `clearsessions`. A no-op for the cache engine (Redis expires
+    keys); drains django_session under the db/cached_db engines.
+    """
+    call_command("clearsessions")
+    return "Cleared expired sessions"
@@ -1,3 +1,231 @@
-from django.test import TestCase
+import uuid
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import redis
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+
+from .models import EmailDelivery
+from .services import email_queue, rate_limit
+from .services.session_cache import _key, cache_user, session_user
+
+
+def _redis_available():
+    url = getattr(settings, "RATE_LIMIT_REDIS_URL", settings.REDIS_URL)
+    try:
+        return redis.Redis.from_url(url, socket_timeout=1).ping()
+    except redis.RedisError:
+        return False
+
+
+class RateLimitTestCase(SimpleTestCase):
+    def setUp(self):
+        # Module-level client/script; start each test from a fresh one
+        rate_limit._client = rate_limit._script = None
+        self.addCleanup(setattr, rate_limit, "_script", None)
+
+
+@skipUnless(_redis_available(), "rate limit Redis not reachable")
+class SlidingWindowTests(RateLimitTestCase):
+    def test_allows_limit_hits_then_waits_out_the_window(self):
+        scope = f"test-{uuid.uuid4().hex}"
+
+        self.assertEqual(rate_limit.hit(scope, "ip", "1.2.3.4", 2, 60), 0)
+        self.assertEqual(rate_limit.hit(scope, "ip", "1.2.3.4", 2, 60), 0)
+
+        wait = rate_limit.hit(scope, "ip", "1.2.3.4", 2, 60)
+        self.assertTrue(59 <= wait <= 60, wait)
+        # Other identifiers have their own window
+        self.assertEqual(rate_limit.hit(scope, "ip", "5.6.7.8", 2, 60), 0)
+
+    def test_rejected_hits_are_not_recorded(self):
+        scope = f"test-{uuid.uuid4().hex}"
+        rate_limit.hit(scope, "ip", "1.2.3.4", 1, 60)
+
+        for _ in range(3):
+            rate_limit.hit(scope, "ip", "1.2.3.4", 1, 60)
+
+        key = rate_limit._client.keys(f"ratelimit:{scope}:*")[0]
+        self.assertEqual(rate_limit._client.zcard(key), 1)
+
+
+class FailOpenTests(RateLimitTestCase):
+    def test_redis_errors_allow_the_request(self):
+        script = mock.Mock(side_effect=redis.ConnectionError("down"))
+
+        with mock.patch.object(rate_limit, "_get_script", return_value=script), \
+                self.assertLogs(rate_limit.logger, "WARNING"):
+            self.assertEqual(rate_limit.check("login", "1.2.3.4", "alice"), 0)
+
+
+class CheckTests(RateLimitTestCase):
+    @mock.patch.object(rate_limit, "hit", return_value=0)
+    def test_account_is_checked_first_and_normalised(self, hit):
+        limits = {"login": {"ip": [(20, 300)], "account": [(10, 900)]}}
+
+        with self.settings(AUTH_RATE_LIMITS=limits):
+            rate_limit.check("login", "1.2.3.4", " Alice ")
+
+        self.assertEqual(hit.call_args_list, [
+            mock.call("login", "account:900", "alice", 10, 900),
+            mock.call("login", "ip:300", "1.2.3.4", 20, 300),
+        ])
+
+    @mock.patch.object(rate_limit, "hit", return_value=30)
+    def test_locked_account_does_not_spend_the_ip_budget(self, hit):
+        self.assertEqual(rate_limit.check("login", "1.2.3.4", "alice"), 30)
+        hit.assert_called_once()
+
+
+class RateLimitedViewTests(TestCase):
+    @mock.patch.object(rate_limit, "check", return_value=42)
+    def test_throttled_login_is_rejected_before_any_query(self, check):
+        with self.assertNumQueries(0):
+            response = self.client.post(
+                "/api/login/",
+                {"username": "alice", "password": "x"},
+                content_type="application/json",
+                REMOTE_ADDR="1.2.3.4",
+            )
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "42")
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["Too many attempts. Try again in 42 seconds."]},
+        )
+        check.assert_called_once_with("login", "1.2.3.4", "alice")
+
+    @mock.patch.object(rate_limit, "check", return_value=42)
+    def test_account_is_read_from_form_posts(self, check):
+        self.client.post("/api/auth/register/", {"email": "bob@example.com"}, REMOTE_ADDR="1.2.3.4")
+
+        check.assert_called_once_with("register", "1.2.3.4", "bob@example.com")
+
+    @mock.patch.object(rate_limit, "check", return_value=0)
+    def test_allowed_request_still_reaches_the_view(self, check):
+        response = self.client.post(
+            "/api/login/",
+            {"username": "nobody", "password": "x"},
+            content_type="application/json",
+        )
+
+        self.assertNotEqual(response.status_code, 429)
+
+
+class SessionUserTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com", "secret-pass-1")
+        self.client.force_login(self.user)
+        cache.clear()
+
+    def request(self):
+        request = RequestFactory().get("/api/session/")
+        request.session = self.client.session
+        dict(request.session.items())  # load before counting queries
+        return request
+
+    def stale_entry(self):
+        cache.set(_key(self.user.pk), {"summary": cache_user(self.user), "auth_hash": "stale"})
+
+    def test_cached_summary_is_answered_without_queries(self):
+        summary = cache_user(self.user)
+        request = self.request()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(session_user(request), summary)
+
+    def test_hash_mismatch_falls_back_to_get_user_and_recaches(self):
+        self.stale_entry()
+
+        self.assertEqual(session_user(self.request())["username"], "alice")
+        self.assertEqual(
+            cache.get(_key(self.user.pk))["auth_hash"],
+            self.user.get_session_auth_hash(),
+        )
+
+    def test_hash_mismatch_after_password_change_flushes_the_session(self):
+        self.stale_entry()
+        # update(): no post_save, so the cached entry survives
+        User.objects.filter(pk=self.user.pk).update(password=make_password("new-pass-2"))
+        request = self.request()
+
+        self.assertIsNone(session_user(request))
+        self.assertNotIn(SESSION_KEY, request.session)
+
+    def test_cached_inactive_user_is_rechecked(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        summary = {**cache_user(self.user), "is_active": False}
+        cache.set(_key(self.user.pk), {"summary": summary, "auth_hash": self.user.get_session_auth_hash()})
+
+        self.assertIsNone(session_user(self.request()))
+
+
+class EmailQueueTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("carol", "carol@example.com", "secret-pass-1")
+
+    def delivery(self, **fields):
+        return EmailDelivery.objects.create(
+            user=self.user, email_type="test", recipient=self.user.email,
+            subject="Hello", body="Code 123456", **fields,
+        )
+
+    def test_deliver_sends_claimable_rows_and_counts_them(self):
+        queued = self.delivery()
+        claimed = self.delivery(status="sending", claimed_at=timezone.now())
+        abandoned = self.delivery(status="sending", claimed_at=timezone.now() - 2 * email_queue.STALE_AFTER)
+
+        sent, retry_ids = email_queue.deliver([queued.pk, claimed.pk, abandoned.pk])
+
+        self.assertEqual((sent, retry_ids), (2, []))
+        self.assertEqual(len(mail.outbox), 2)
+        queued.refresh_from_db()
+        self.assertEqual((queued.status, queued.attempts, queued.body), ("sent", 1, ""))
+        # Another sender's fresh claim is left alone
+        self.assertEqual(EmailDelivery.objects.get(pk=claimed.pk).status, "sending")
+
+    @mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", side_effect=OSError("rejected"))
+    def test_rejected_messages_are_requeued_until_max_attempts(self, send_messages):
+        retry = self.delivery()
+        last = self.delivery(attempts=email_queue.MAX_ATTEMPTS - 1)
+
+        with self.assertLogs(email_queue.logger, "WARNING"):
+            sent, retry_ids = email_queue.deliver([retry.pk, last.pk])
+
+        self.assertEqual((sent, retry_ids), (0, [retry.pk]))
+        self.assertEqual(EmailDelivery.objects.get(pk=retry.pk).status, "queued")
+        self.assertEqual(EmailDelivery.objects.get(pk=last.pk).status, "failed")
+
+    @mock.patch("django.core.mail.backends.locmem.EmailBackend.open", side_effect=OSError("no smtp"))
+    def test_connection_failure_hands_claims_back(self, open_connection):
+        delivery = self.delivery()
+
+        with self.assertRaises(OSError):
+            email_queue.deliver([delivery.pk])
+
+        delivery.refresh_from_db()
+        self.assertEqual((delivery.status, delivery.attempts), ("queued", 0))
+
+    def test_stale_ids_skip_recent_rows(self):
+        old = self.delivery(created_at=timezone.now() - timedelta(hours=1))
+        self.delivery()
+
+        self.assertEqual(email_queue.stale_delivery_ids(), [old.pk])
+
+    @mock.patch("user_accounts.tasks.send_email_deliveries.delay", side_effect=ConnectionError("broker down"))
+    def test_broker_outage_leaves_the_row_for_the_sweep(self, delay):
+        # Callbacks run as captureOnCommitCallbacks exits, inside assertLogs
+        with self.assertLogs(email_queue.logger, "ERROR"), \
+                self.captureOnCommitCallbacks(execute=True):
+            delivery = email_queue.queue_email(self.user, "test", "Hello", "Body")
+
+        delay.assert_called_once_with([delivery.pk])
+        self.assertEqual(EmailDelivery.objects.get(pk=delivery.pk).status, "queued")
@@ -2,10 +2,9 @@ from django.contrib.auth import authenticate, login, logout
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.middleware.csrf import get_token
 from django.contrib.auth.models import User
-from django.contrib.auth.hashers import check_password
 from django.db import transaction
 
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
@@ -19,10 +18,13 @@ from .models import EmailVerification
 from django.utils import timezone
 from datetime import timedelta
 from .services.send_verification_email import send_verification
+from .services.rate_limit import rate_limit
+from .services.session_cache import cache_user, session_user
 # ---------------------------------------------------------
 # CSRF TOKEN VIEW
 # ---------------------------------------------------------
 @api_view(["GET"])
+@authentication_classes([])  # no session/user lookup needed for a token
 @permission_classes([AllowAny])
 @ensure_csrf_cookie
 def csrf_token_view(request):
@@ -39,6 +41,7 @@ def csrf_token_view(request):
 # ---------------------------------------------------------
 # REGISTER VIEW
 # ---------------------------------------------------------
+@rate_limit("register", "email")
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def register_view(request):
@@ -80,6 +83,7 @@ def register_view(request):
 # ---------------------------------------------------------
 # LOGIN VIEW
 # ---------------------------------------------------------
+@rate_limit("login", "username")
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def login_view(request):
@@ -93,15 +97,11 @@ def login_view(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    try:
-        user = User.objects.get(username=username)
-    except User.DoesNotExist:
-        return Response(
-            {"non_field_errors": ["Invalid username or password"]},
-            status=status.HTTP_401_UNAUTHORIZED
-        )
+    # One lookup; unknown users cost the same hashing as a wrong password,
+    # and an outdated hash is upgraded on success (see backends.LoginBackend)
+    user = authenticate(request, username=username, password=password)
 
-    if not check_password(password, user.password):
+    if user is None:
         return Response(
             {"non_field_errors": ["Invalid username or password"]},
             status=status.HTTP_401_UNAUTHORIZED
@@ -117,6 +117,7 @@ def login_view(request):
         )
 
     login(request, user)
+    cache_user(user)  # session_view answers from this
 
     return Response({
         "message": "Login successful",
@@ -150,22 +151,18 @@ def logout_view(request):
 # SESSION VIEW
 # ---------------------------------------------------------
 @api_view(["GET"])
+@authentication_classes([])  # answered from the cached session, not auth_user
 @permission_classes([AllowAny])
 def session_view(request):
     """
     Returns current session authentication state.
     Useful for React app bootstrapping.
     """
-    if request.user.is_authenticated:
+    user = session_user(request)
+    if user is not None:
         return Response({
             "authenticated": True,
-            "user": {
-                "id": request.user.id,
-                "username": request.user.username,
-                "email": request.user.email,
-                "first_name": request.user.first_name,
-                "is_active": request.user.is_active,
-            }
+            "user": user,
         })
 
     return Response({
@@ -296,12 +293,13 @@ def verify_email_view(request, token=None):
 # ---------------------------------------------------------
 # RESEND VERIFICATION EMAIL
 # ---------------------------------------------------------
+@rate_limit("resend", "email")
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def resend_verification_view(request):
     """
     Resends verification email with:
-    - Rate limiting
+    - Rate limiting (60 s cooldown, hourly cap; checked in Redis first)
     - Enumeration protection
     - Controlled token lifecycle
     """
@@ -330,56 +328,7 @@ def resend_verification_view(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    now = timezone.now()
-
-    # ---- Rate limiting strategy ----
-    recent_verification = (
-        EmailVerification.objects
-        .filter(user=user)
-        .order_by("-created_at")
-        .first()
-    )
-
-    if recent_verification:
-        # Cooldown: 60 seconds between sends
-        cooldown_seconds = 60
-        elapsed = (now - recent_verification.created_at).total_seconds()
-
-        if elapsed < cooldown_seconds:
-            return Response(
-                {
-                    "non_field_errors": [
-                        f"Please wait {int(cooldown_seconds - elapsed)} seconds before retrying."
-                    ]
-                },
-                status=status.HTTP_429_TOO_MANY_REQUESTS
-            )
-
-    # ---- Hourly cap ----
-    one_hour_ago = now - timedelta(hours=1)
-    hourly_count = EmailVerification.objects.filter(
-        user=user,
-        created_at__gte=one_hour_ago
-    ).count()
-
-    if hourly_count >= 5:
-        return Response(
-            {
-                "non_field_errors": [
-                    "Maximum resend attempts reached. Try again later."
-                ]
-            },
-            status=status.HTTP_429_TOO_MANY_REQUESTS
-        )
-
-    # ---- Controlled token rotation ----
-    # Keep last token only for traceability (optional design choice)
-    #EmailVerification.objects.filter(user=user).delete()
-    EmailVerification.objects.filter(
-        user=user,
-        used_at__isnull=True
-    ).update(used_at=timezone.now())
-
+    # ---- Controlled token rotation (inside send_verification) ----
     send_verification(user)
 
     return Response(generic_response, status=status.HTTP_200_OK)
\ No newline at end of file
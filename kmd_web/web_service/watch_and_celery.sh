@@ -75,7 +75,9 @@ PROJECT_DIR="$HOME_DIR/$PROJECT_RELATIVE_PATH"
 CELERY_SERVICE="rsmc-worker"
 WRF_SERVICE="watch-wrf"
 
-CELERY_UNIT="/etc/systemd/system/$CELERY_SERVICE.service"
+# One templated worker unit per Celery queue (rsmc-worker@render, ...)
+CELERY_QUEUES=(default io render)
+CELERY_UNIT="/etc/systemd/system/$CELERY_SERVICE@.service"
 WRF_UNIT="/etc/systemd/system/$WRF_SERVICE.service"
 
 RUN_SCRIPT="$PROJECT_DIR/run.sh"
@@ -97,18 +99,33 @@ echo "✅ Created directories"
 # --------------------------------------------------
 cat > "$RUN_SCRIPT" <<'EOL'
 #!/bin/bash
+# Usage: run.sh [default|io|render]
+# One worker per queue (see CELERY_TASK_ROUTES); beat runs with the
+# default worker. Without an argument a single worker serves all queues.
 
 BASE_DIR=$(dirname "$(realpath "$0")")
+QUEUE="${1:-all}"
 
 source "$BASE_DIR/venv/bin/activate"
 
 cd "$BASE_DIR"
 
+BEAT=(--beat --schedule="$BASE_DIR/run/celerybeat-schedule")
+
+case "$QUEUE" in
+    render)  OPTIONS=(-Q render --concurrency="${RENDER_CONCURRENCY:-$(nproc)}" --prefetch-multiplier=1) ;;
+    io)      OPTIONS=(-Q io --concurrency="${IO_CONCURRENCY:-4}") ;;
+    default) OPTIONS=(-Q default --concurrency="${DEFAULT_CONCURRENCY:-2}" "${BEAT[@]}") ;;
+    all)     OPTIONS=(-Q default,io,render --concurrency=2 "${BEAT[@]}") ;;
+    *)       echo "Unknown queue: $QUEUE" >&2; exit 1 ;;
+esac
+
 exec "$BASE_DIR/venv/bin/celery" \
      -A rsmc_config.config.celery worker \
      --loglevel=INFO \
-     --concurrency=2 \
-     --pidfile="$BASE_DIR/run/celery.pid"
+     -n "$QUEUE@%h" \
+     "${OPTIONS[@]}" \
+     --pidfile="$BASE_DIR/run/celery-$QUEUE.pid"
 EOL
 
 chmod +x "$RUN_SCRIPT"
@@ -121,7 +138,7 @@ echo "✅ Created $RUN_SCRIPT"
 # --------------------------------------------------
 cat > "$CELERY_UNIT" <<EOL
 [Unit]
-Description=RSMC Celery Worker
+Description=RSMC Celery Worker (%i queue)
 After=network.target redis-server.service
 Requires=redis-server.service
 
@@ -133,7 +150,7 @@ WorkingDirectory=$PROJECT_DIR
 
 EnvironmentFile=$ENV_FILE
 
-ExecStart=$RUN_SCRIPT
+ExecStart=$RUN_SCRIPT %i
 
 Restart=always
 RestartSec=5
@@ -193,7 +210,14 @@ systemctl daemon-reload
 # --------------------------------------------------
 echo "🚀 Enabling and starting services..."
 
-systemctl enable --now $CELERY_SERVICE
+# The single all-queues worker is replaced by per-queue instances
+if systemctl list-unit-files "$CELERY_SERVICE.service" | grep -q "$CELERY_SERVICE.service"; then
+    systemctl disable --now $CELERY_SERVICE || true
+fi
+
+for QUEUE in "${CELERY_QUEUES[@]}"; do
+    systemctl enable --now "$CELERY_SERVICE@$QUEUE"
+done
 systemctl enable --now $WRF_SERVICE
 
 # --------------------------------------------------
@@ -203,11 +227,13 @@ echo ""
 echo "✅ Services started successfully"
 echo ""
 
-systemctl status $CELERY_SERVICE --no-pager
+for QUEUE in "${CELERY_QUEUES[@]}"; do
+    systemctl status "$CELERY_SERVICE@$QUEUE" --no-pager
+done
 echo ""
 systemctl status $WRF_SERVICE --no-pager
 
 echo ""
 echo "📊 Logs:"
-echo "journalctl -u $CELERY_SERVICE -f"
+echo "journalctl -u '$CELERY_SERVICE@*' -f"
 echo "journalctl -u $WRF_SERVICE -f"
\ No newline at end of file
@@ -4,6 +4,7 @@ from netCDF4 import Dataset
 from wrf import getvar
 from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_GET
+from forecasts.services.file_serving import file_validators, not_modified, set_validators
 
 DATA_DIR = "/data/wrf/"  # CHANGE THIS
 
@@ -32,16 +33,23 @@ def get_field(request):
     if not os.path.exists(file_path):
         return JsonResponse({"error": "File not found"}, status=404)
 
+    # Validators come from the wrfout file + variable; 304 skips NetCDF decoding
+    etag, last_modified = file_validators(file_path, variable)
+    response = not_modified(request, etag, last_modified)
+    if response is not None:
+        return response
+
     try:
         ncfile = Dataset(file_path)
         var = getvar(ncfile, variable, timeidx=0)
         data = var.values.astype(np.float32)
         ncfile.close()
 
-        return HttpResponse(
+        response = HttpResponse(
             data.tobytes(),
             content_type="application/octet-stream"
         )
+        return set_validators(response, etag, last_modified)
 
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)